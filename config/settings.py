@@ -94,6 +94,9 @@ DATABASES = {
         'PASSWORD': os.getenv('SQL_PASSWORD', 'music_password'),
         'HOST': os.getenv('SQL_HOST', 'db'), # docker-compose 서비스 이름
         'PORT': os.getenv('SQL_PORT', '5432'), # PostgreSQL 기본 포트
+        # 요청마다 새 연결을 맺지 않도록 연결 재사용 (gunicorn gthread 워커의 스레드별로 유지)
+        'CONN_MAX_AGE': int(os.getenv('SQL_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,  # 재사용 전 끊어진 연결 확인
         'OPTIONS': {
             'sslmode': 'require',  # AWS RDS는 SSL 연결 필요
         } if os.getenv('SQL_HOST', '').endswith('.rds.amazonaws.com') else {},
@@ -158,6 +161,33 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'  # UTC 시간대 사용 (시간대 혼동 방지)
 CELERY_ENABLE_UTC = True  # UTC 시간 사용
 
+# 재생 기록 flush 전용 큐 (재시도가 긴 AI/S3 작업 뒤에 밀리지 않도록 별도 워커가 처리)
+PLAY_LOG_FLUSH_QUEUE = 'playlogs'
+CELERY_TASK_ROUTES = {
+    'music.tasks.flush_play_log_buffer': {'queue': PLAY_LOG_FLUSH_QUEUE},
+}
+
+# Redis 설정 (선택)
+# 설정 시 재생 기록 버퍼(Celery가 일괄 저장)와 캐시 백엔드로 사용 (미설정 시 동기 INSERT + 로컬 메모리 캐시)
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+# 캐시 설정
+# REDIS_URL 설정 시 모든 워커가 공유하는 Redis 캐시, 미설정 시 프로세스별 로컬 메모리 캐시
+# (로컬 메모리 캐시에서는 다른 워커의 무효화가 보이지 않으므로 버전 기반 캐시 TTL을 짧게 제한, versioned_cache 참고)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ==============================================
 # Celery Beat 스케줄 설정 (주기적 작업)
 # ==============================================
@@ -193,6 +223,14 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'music.tasks.cleanup_old_realtime_charts',
         'schedule': crontab(hour=3, minute=0),  # 매일 03:00
     },
+
+    # 재생 기록 버퍼 flush: 5초마다 (REDIS_URL 설정 시에만 실제 저장 발생)
+    # 다음 주기가 오기 전에 실행되지 못한 flush는 버려서 브로커에 쌓이지 않게 함
+    'flush-play-log-buffer': {
+        'task': 'music.tasks.flush_play_log_buffer',
+        'schedule': 5.0,  # 5초마다
+        'options': {'expires': 5, 'queue': PLAY_LOG_FLUSH_QUEUE},
+    },
 }
 
 # ==============================================
@@ -218,6 +256,12 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# 프로덕션에서는 JSON 렌더러만 사용 (Browsable API 렌더링/뷰 설명 조회 생략)
+if not DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'rest_framework.renderers.JSONRenderer',
+    )
+
 from datetime import timedelta
 
 # ==============================================
@@ -435,6 +479,10 @@ def spectacular_postprocessing_hook(result, generator, request, public):
     return result
 
 
+# API 문서(/api/schema, /api/docs, /api/redoc) 노출 여부
+# 문서 서버가 아닌 인스턴스에서는 0으로 설정하여 스키마 생성 엔드포인트 자체를 등록하지 않음
+API_DOCS_ENABLED = os.getenv('API_DOCS_ENABLED', '1') == '1'
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Music Streaming & AI Generation API',
     'DESCRIPTION': '음악 스트리밍 및 AI 음악 생성 플랫폼 Backend API',
@@ -18,14 +18,18 @@ urlpatterns = [
     path('api/v1/', include('music.urls')),
     # API 엔드포인트
     path('api/music/', include('music.urls')),
-    # Swagger/OpenAPI 문서
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),  # OpenAPI 스키마 JSON
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),  # Swagger UI
-    path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),  # ReDoc UI
     # Prometheus 메트릭 엔드포인트 (django_prometheus는 /metrics 경로 사용)
     path('', include('django_prometheus.urls')),  # /metrics 엔드포인트
 ]
 
+# Swagger/OpenAPI 문서 (API_DOCS_ENABLED=0인 인스턴스에서는 등록하지 않음)
+if settings.API_DOCS_ENABLED:
+    urlpatterns += [
+        path('api/schema/', SpectacularAPIView.as_view(), name='schema'),  # OpenAPI 스키마 JSON
+        path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),  # Swagger UI
+        path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),  # ReDoc UI
+    ]
+
 
 # 개발 환경(DEBUG=True)에서 정적 파일(CSS, JS, 이미지) 및 미디어 파일을 서빙하기 위한 설정입니다.
 # 프로덕션 환경에서는 웹 서버(Nginx, Traefik 등)가 직접 정적 파일을 서빙해야 합니다.
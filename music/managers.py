@@ -18,9 +18,12 @@ class SoftDeleteQuerySet(models.QuerySet):
         삭제되지 않은 레코드만 반환
         
         Returns:
-            is_deleted가 False 또는 None인 레코드
+            is_deleted가 False인 레코드
+
+        is_deleted는 NOT NULL boolean이므로 (migrations/0005) 단일 비교로
+        활성 행 부분 인덱스(WHERE is_deleted = false)를 그대로 사용합니다.
         """
-        return self.filter(is_deleted__in=[False, None])
+        return self.filter(is_deleted=False)
     
     def deleted(self):
         """
@@ -83,7 +86,7 @@ class SoftDeleteManager(models.Manager):
         """
         기본 QuerySet 반환
         
-        is_deleted가 False 또는 None인 레코드만 반환합니다.
+        is_deleted가 False인 레코드만 반환합니다.
         """
         return SoftDeleteQuerySet(self.model, using=self._db).active()
     
@@ -123,4 +126,4 @@ class ActiveObjectsManager(models.Manager):
     
     def get_queryset(self):
         """삭제되지 않은 레코드만 반환"""
-        return super().get_queryset().filter(is_deleted__in=[False, None])
+        return super().get_queryset().filter(is_deleted=False)
@@ -0,0 +1,34 @@
+"""
+플레이리스트 다음 곡 순서(next_order) 컬럼 추가
+
+곡 추가 시 `ORDER BY "order" DESC LIMIT 1` 조회 없이
+카운터 컬럼을 원자적으로 증가시켜 순서를 할당합니다.
+기존 플레이리스트는 현재 마지막 순서 + 1로 채웁니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = []
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                ALTER TABLE playlists
+                    ADD COLUMN IF NOT EXISTS next_order integer NOT NULL DEFAULT 1;
+
+                UPDATE playlists p
+                SET next_order = sub.max_order + 1
+                FROM (
+                    SELECT playlist_id, MAX("order") AS max_order
+                    FROM playlist_items
+                    WHERE is_deleted IS NOT TRUE
+                    GROUP BY playlist_id
+                ) sub
+                WHERE p.playlist_id = sub.playlist_id
+                  AND sub.max_order IS NOT NULL;
+            """,
+            reverse_sql="ALTER TABLE playlists DROP COLUMN IF EXISTS next_order;",
+        ),
+    ]
@@ -0,0 +1,50 @@
+"""
+플레이리스트 좋아요 (user_id, playlist_id) 유니크 인덱스 추가
+
+좋아요 등록을 get_or_create 한 번으로 처리할 수 있도록
+사용자-플레이리스트 쌍의 중복 행을 막습니다.
+기존 중복 행은 활성 좋아요(없으면 가장 먼저 생성된 행) 하나만 남기고 삭제합니다.
+유니크 인덱스가 삭제된 행까지 포함하므로 소프트 삭제로는 정리할 수 없으며,
+이 DELETE는 되돌릴 수 없습니다. (역방향 마이그레이션은 인덱스만 삭제)
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+(정리 후 인덱스 생성 전에 중복 좋아요가 생겨 생성이 실패하면, 남은 INVALID 인덱스를 삭제하고 다시 실행)
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0001_add_playlist_next_order'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                DELETE FROM playlist_likes
+                WHERE like_id IN (
+                    SELECT like_id FROM (
+                        SELECT like_id,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY user_id, playlist_id
+                                   ORDER BY (is_deleted IS TRUE), like_id
+                               ) AS rn
+                        FROM playlist_likes
+                    ) ranked
+                    WHERE ranked.rn > 1
+                );
+            """,
+            # 삭제된 중복 행은 복구할 수 없음
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS playlist_likes_user_playlist_uniq
+                    ON playlist_likes (user_id, playlist_id);
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlist_likes_user_playlist_uniq;",
+        ),
+    ]
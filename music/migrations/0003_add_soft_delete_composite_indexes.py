@@ -0,0 +1,67 @@
+"""
+소프트 삭제 필터 패턴에 맞춘 복합 인덱스 추가
+
+SoftDeleteManager가 모든 조회에 is_deleted = false 조건을 붙이므로
+(FK, 정렬 컬럼) 복합 인덱스를 활성 행만 담는 부분 인덱스로 생성합니다.
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0002_add_playlist_likes_unique'),
+    ]
+
+    operations = [
+        # 플레이리스트 좋아요 개수 집계 (playlist_id = ? AND NOT is_deleted)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlist_likes_playlist_live_idx
+                    ON playlist_likes (playlist_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlist_likes_playlist_live_idx;",
+        ),
+        # 음악별 재생 로그 최신순 조회 (MusicPlayLogsView)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS play_logs_music_played_live_idx
+                    ON play_logs (music_id, played_at DESC) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS play_logs_music_played_live_idx;",
+        ),
+        # 사용자별 / 공개 범위별 플레이리스트 최신순 조회 (PlaylistListCreateView)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlists_user_created_live_idx
+                    ON playlists (user_id, visibility, created_at DESC) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlists_user_created_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlists_visibility_created_live_idx
+                    ON playlists (visibility, created_at DESC) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlists_visibility_created_live_idx;",
+        ),
+        # 플레이리스트 곡 목록 순서 조회 / 중복 곡 확인
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlist_items_playlist_order_live_idx
+                    ON playlist_items (playlist_id, "order") WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlist_items_playlist_order_live_idx;",
+        ),
+        # 이메일로 사용자 조회 (로그인, 중복 확인)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS users_email_live_idx
+                    ON users (email) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS users_email_live_idx;",
+        ),
+    ]
@@ -0,0 +1,53 @@
+"""
+플레이리스트 항목 (playlist_id, music_id) 부분 유니크 인덱스 추가
+
+삭제되지 않은 항목에 한해 같은 곡이 한 플레이리스트에 두 번 들어가지 않도록
+DB에서 보장합니다. 곡 추가 시 중복 확인 SELECT 없이 INSERT 한 번으로 처리하고,
+유니크 위반(IntegrityError)을 "이미 추가된 곡"으로 응답합니다.
+기존 중복 행은 가장 먼저 추가된 항목만 남기고 소프트 삭제합니다.
+is_deleted가 NULL인 행도 0005에서 false로 채워지므로 활성 행과 함께 중복을 정리합니다.
+(지금까지 조회되던 false 행을 NULL 행보다 우선해서 남김)
+(NULL 행을 빼고 정리하면 0005의 NULL -> false 변경이 유니크 인덱스에 위반되어 실패)
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0003_add_soft_delete_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                UPDATE playlist_items
+                SET is_deleted = true, updated_at = NOW()
+                WHERE item_id IN (
+                    SELECT item_id FROM (
+                        SELECT item_id,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY playlist_id, music_id
+                                   ORDER BY (is_deleted IS NULL), item_id
+                               ) AS rn
+                        FROM playlist_items
+                        WHERE is_deleted IS NOT TRUE
+                    ) ranked
+                    WHERE ranked.rn > 1
+                );
+            """,
+            # 소프트 삭제한 중복 항목은 어떤 행이 원래 활성 상태였는지 알 수 없으므로 되돌리지 않음
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS playlist_items_playlist_music_live_uniq
+                    ON playlist_items (playlist_id, music_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlist_items_playlist_music_live_uniq;",
+        ),
+    ]
@@ -0,0 +1,82 @@
+"""
+is_deleted 컬럼을 NOT NULL boolean으로 고정하고 활성 행 부분 인덱스 추가
+
+SoftDeleteManager는 is_deleted__in=[False, None] 으로 조회하지만 Django는 IN 목록의 None을
+제거하므로 실제 SQL은 is_deleted IN (false) 이고, NULL 행은 삭제된 것처럼 조회되지 않았습니다.
+NULL을 false로 채우고 NOT NULL + DEFAULT false를 걸어 소프트 삭제 판별을 단일 boolean 비교로 통일합니다.
+
+부분 인덱스는 운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+SOFT_DELETE_TABLES = [
+    'music',
+    'users',
+    'playlists',
+    'playlist_items',
+    'playlist_likes',
+    'play_logs',
+]
+
+
+def _not_null_sql(table):
+    return f"""
+        UPDATE {table} SET is_deleted = false WHERE is_deleted IS NULL;
+        ALTER TABLE {table} ALTER COLUMN is_deleted SET DEFAULT false;
+        ALTER TABLE {table} ALTER COLUMN is_deleted SET NOT NULL;
+    """
+
+
+def _not_null_reverse_sql(table):
+    return f"""
+        ALTER TABLE {table} ALTER COLUMN is_deleted DROP NOT NULL;
+        ALTER TABLE {table} ALTER COLUMN is_deleted DROP DEFAULT;
+    """
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0004_add_playlist_items_unique_live'),
+    ]
+
+    operations = [
+        *[
+            migrations.RunSQL(sql=_not_null_sql(table), reverse_sql=_not_null_reverse_sql(table))
+            for table in SOFT_DELETE_TABLES
+        ],
+        # 사용자별 플레이리스트 최신순 조회 (visibility 조건 없이 user_id로만 조회하는 경우)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlists_owner_created_live_idx
+                    ON playlists (user_id, created_at DESC) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlists_owner_created_live_idx;",
+        ),
+        # 사용자가 좋아요한 플레이리스트 조회 (PlaylistLikedView)
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS playlist_likes_user_live_idx
+                    ON playlist_likes (user_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS playlist_likes_user_live_idx;",
+        ),
+        # 아티스트/앨범별 곡 목록 조회
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_artist_live_idx
+                    ON music (artist_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_artist_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_album_live_idx
+                    ON music (album_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_album_live_idx;",
+        ),
+    ]
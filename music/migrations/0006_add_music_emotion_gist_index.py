@@ -0,0 +1,31 @@
+"""
+감정(Arousal-Valence) 기반 추천용 GiST 인덱스 추가
+
+(valence, arousal)을 point로 보는 표현식 인덱스로, 추천 View의
+ORDER BY point(valence::float8, arousal::float8) <-> point(x, y) LIMIT n
+쿼리를 전체 스캔 + 정렬 대신 인덱스 KNN 탐색으로 처리합니다.
+(2차원 거리 검색이므로 pgvector 확장 없이 PostgreSQL 기본 GiST point 연산자 사용)
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0005_enforce_is_deleted_not_null'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_emotion_point_gist_idx
+                    ON music USING gist (point(valence::float8, arousal::float8))
+                    WHERE is_deleted = false AND valence IS NOT NULL AND arousal IS NOT NULL;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_emotion_point_gist_idx;",
+        ),
+    ]
@@ -0,0 +1,89 @@
+"""
+music.tag_ids 비정규화 컬럼 추가 (태그 기반 추천용)
+
+태그 기반 추천은 music_tags를 tag_id IN (...)으로 필터링한 뒤 music_id별 GROUP BY 집계를 하고,
+다시 music을 조회했습니다. 곡의 태그 ID를 music.tag_ids(bigint[])에 함께 저장하고
+GIN 인덱스를 걸어, tag_ids && ARRAY[...] 조건으로 music에서 후보 곡을 바로 조회합니다.
+
+태그는 외부 파이프라인에서도 music_tags에 직접 기록되므로, Django 시그널이 아니라
+music_tags 트리거로 tag_ids를 동기화합니다. (모델 필드로 선언하지 않아 save() 시 덮어쓰지 않음)
+
+GIN 인덱스는 운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0006_add_music_emotion_gist_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="ALTER TABLE music ADD COLUMN IF NOT EXISTS tag_ids bigint[] NOT NULL DEFAULT '{}';",
+            reverse_sql="ALTER TABLE music DROP COLUMN IF EXISTS tag_ids;",
+        ),
+        # 기존 태그 채우기
+        migrations.RunSQL(
+            sql="""
+                UPDATE music m
+                   SET tag_ids = t.tag_ids
+                  FROM (
+                        SELECT music_id, array_agg(tag_id ORDER BY tag_id) AS tag_ids
+                          FROM music_tags
+                         WHERE is_deleted = false
+                         GROUP BY music_id
+                       ) t
+                 WHERE m.music_id = t.music_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # music_tags 변경 시 해당 곡의 tag_ids 재계산 (소프트 삭제/복구 UPDATE 포함)
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION music_refresh_tag_ids(target_music_id bigint) RETURNS void AS $$
+                BEGIN
+                    UPDATE music
+                       SET tag_ids = COALESCE((
+                            SELECT array_agg(tag_id ORDER BY tag_id)
+                              FROM music_tags
+                             WHERE music_id = target_music_id AND is_deleted = false
+                       ), '{}')
+                     WHERE music_id = target_music_id;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE OR REPLACE FUNCTION music_tags_sync_tag_ids() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        PERFORM music_refresh_tag_ids(OLD.music_id);
+                    END IF;
+                    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.music_id IS DISTINCT FROM OLD.music_id) THEN
+                        PERFORM music_refresh_tag_ids(NEW.music_id);
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                DROP TRIGGER IF EXISTS music_tags_sync_tag_ids ON music_tags;
+                CREATE TRIGGER music_tags_sync_tag_ids
+                    AFTER INSERT OR UPDATE OF music_id, tag_id, is_deleted OR DELETE ON music_tags
+                    FOR EACH ROW EXECUTE FUNCTION music_tags_sync_tag_ids();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS music_tags_sync_tag_ids ON music_tags;
+                DROP FUNCTION IF EXISTS music_tags_sync_tag_ids();
+                DROP FUNCTION IF EXISTS music_refresh_tag_ids(bigint);
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_tag_ids_gin_idx
+                    ON music USING gin (tag_ids) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_tag_ids_gin_idx;",
+        ),
+    ]
@@ -0,0 +1,37 @@
+"""
+장르/태그 기반 곡 조회용 부분 인덱스 추가
+
+- music (genre, music_id): 추천 View의 같은 장르 곡 ID 조회
+  (genre = X AND music_id != base)를 테이블 접근 없이 인덱스 전용 스캔으로 처리
+- music_tags (tag_id, music_id): 태그 검색 등 태그 ID로 곡을 찾는 조회
+  (모델의 (music, tag) unique_together 인덱스는 선두 컬럼이 music_id라 태그 기준 조회에 쓰이지 않음)
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0007_add_music_tag_ids'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_genre_live_idx
+                    ON music (genre, music_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_genre_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_tags_tag_live_idx
+                    ON music_tags (tag_id, music_id) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_tags_tag_live_idx;",
+        ),
+    ]
@@ -0,0 +1,67 @@
+"""
+검색에서 조회하는 테이블의 is_deleted를 NOT NULL boolean으로 고정하고 이름 조회용 부분 인덱스 추가
+
+0005에서 제외된 artists, albums, tags, music_tags, ai_info도 같은 방식으로
+NULL을 false로 채우고 NOT NULL + DEFAULT false를 걸어,
+is_deleted IN (false, NULL) 대신 is_deleted = false 단일 비교로 부분 인덱스를 사용하게 합니다.
+
+- artists (artist_name): 검색 결과 연동 시 아티스트명 일괄 조회
+- albums (artist_id, album_name): 검색 결과 연동 시 (앨범명, 아티스트) 일괄 조회
+
+부분 인덱스는 운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+SEARCH_SOFT_DELETE_TABLES = [
+    'artists',
+    'albums',
+    'tags',
+    'music_tags',
+    'ai_info',
+]
+
+
+def _not_null_sql(table):
+    return f"""
+        UPDATE {table} SET is_deleted = false WHERE is_deleted IS NULL;
+        ALTER TABLE {table} ALTER COLUMN is_deleted SET DEFAULT false;
+        ALTER TABLE {table} ALTER COLUMN is_deleted SET NOT NULL;
+    """
+
+
+def _not_null_reverse_sql(table):
+    return f"""
+        ALTER TABLE {table} ALTER COLUMN is_deleted DROP NOT NULL;
+        ALTER TABLE {table} ALTER COLUMN is_deleted DROP DEFAULT;
+    """
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0008_add_genre_and_tag_lookup_indexes'),
+    ]
+
+    operations = [
+        *[
+            migrations.RunSQL(sql=_not_null_sql(table), reverse_sql=_not_null_reverse_sql(table))
+            for table in SEARCH_SOFT_DELETE_TABLES
+        ],
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS artists_name_live_idx
+                    ON artists (artist_name) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS artists_name_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS albums_artist_name_live_idx
+                    ON albums (artist_id, album_name) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS albums_artist_name_live_idx;",
+        ),
+    ]
@@ -0,0 +1,46 @@
+"""
+AI 음악 검색(icontains)용 pg_trgm GIN 인덱스 추가
+
+Django의 icontains는 PostgreSQL에서 UPPER(col::text) LIKE UPPER('%검색어%')로 변환되어
+앞에 %가 붙은 패턴이라 B-tree 인덱스를 사용할 수 없고 전체 스캔이 발생합니다.
+같은 표현식 UPPER(col::text)에 gin_trgm_ops 인덱스를 만들어 LIKE 검색을 인덱스로 처리합니다.
+
+- music (music_name): AI 음악 검색의 노래 제목 검색
+- ai_info (input_prompt): AI 음악 검색의 프롬프트 검색
+
+pg_trgm 확장이 필요하며, 인덱스는 운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0009_enforce_search_tables_is_deleted_not_null'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+            # 다른 인덱스/기능에서 사용할 수 있으므로 확장은 되돌리지 않음
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS music_name_upper_trgm_idx
+                    ON music USING gin ((upper(music_name::text)) gin_trgm_ops)
+                    WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS music_name_upper_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ai_info_prompt_upper_trgm_idx
+                    ON ai_info USING gin ((upper(input_prompt::text)) gin_trgm_ops)
+                    WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS ai_info_prompt_upper_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,40 @@
+"""
+검색 결과 연동의 대소문자 무시 이름 조회용 표현식 인덱스 추가
+
+검색 결과 연동과 곡 저장(Artists/Albums.get_or_create_by_name)에서 아티스트/앨범을
+lower(이름)으로 비교해 "IU"와 "iu" 같은 표기 차이로 중복 행이 생기지 않게 했으므로,
+같은 표현식 lower(col)에 부분 인덱스를 추가합니다.
+(0009의 원본 컬럼 인덱스는 이름을 그대로 비교하는 조회에서 계속 사용하므로 유지)
+
+- artists (lower(artist_name)): 아티스트명 일괄 조회
+- albums (artist_id, lower(album_name)): (앨범명, 아티스트) 일괄 조회
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0010_add_ai_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS artists_lower_name_live_idx
+                    ON artists (lower(artist_name)) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS artists_lower_name_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS albums_artist_lower_name_live_idx
+                    ON albums (artist_id, lower(album_name)) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS albums_artist_lower_name_live_idx;",
+        ),
+    ]
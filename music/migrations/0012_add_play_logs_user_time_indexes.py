@@ -0,0 +1,37 @@
+"""
+사용자 통계/재생 기록 조회용 play_logs 인덱스 추가
+
+- play_logs (user_id, played_at DESC): 사용자 통계의 user_id = ? AND played_at >= 이번 달 시작 조건을
+  인덱스 범위 스캔으로 처리
+- play_logs USING brin (played_at): 재생 기록은 시간순으로 쌓이므로, 사용자 구분 없이
+  시간 범위로 조회하는 차트 집계/오래된 기록 정리를 작은 BRIN 인덱스로 처리
+
+운영 DB 잠금을 피하기 위해 CONCURRENTLY로 생성하며, 트랜잭션 밖에서 실행합니다.
+"""
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('music', '0011_add_artist_album_lower_name_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS play_logs_user_played_live_idx
+                    ON play_logs (user_id, played_at DESC) WHERE is_deleted = false;
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS play_logs_user_played_live_idx;",
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS play_logs_played_at_brin_idx
+                    ON play_logs USING brin (played_at);
+            """,
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS play_logs_played_at_brin_idx;",
+        ),
+    ]
@@ -58,9 +58,12 @@ class SoftDeleteMixin(models.Model):
         else:
             # 소프트 삭제: is_deleted=True로 업데이트
             self.is_deleted = True
+            update_fields = ['is_deleted']
             if hasattr(self, 'updated_at'):
                 self.updated_at = timezone.now()
-            self.save(using=using)
+                update_fields.append('updated_at')
+            # 변경된 컬럼만 UPDATE (only()로 일부 컬럼만 조회한 인스턴스도 안전하게 삭제)
+            self.save(using=using, update_fields=update_fields)
     
     def restore(self, using=None):
         """
@@ -70,9 +73,12 @@ class SoftDeleteMixin(models.Model):
             using: 데이터베이스 별칭
         """
         self.is_deleted = False
+        update_fields = ['is_deleted']
         if hasattr(self, 'updated_at'):
             self.updated_at = timezone.now()
-        self.save(using=using)
+            update_fields.append('updated_at')
+        # 변경된 컬럼만 UPDATE (전체 행 재저장 방지)
+        self.save(using=using, update_fields=update_fields)
     
     def hard_delete(self, using=None, keep_parents=False):
         """
@@ -6,6 +6,8 @@
 #   * Remove `managed = False` lines if you wish to allow Django to create, modify, and delete the table
 # Feel free to rename the models, but don't rename db_table values or field names.
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest, Lower
 from .mixins import TrackableMixin
 from .managers import SoftDeleteManager
 
@@ -42,6 +44,28 @@ class Albums(TrackableMixin, models.Model):
     class Meta:
         managed = False
         db_table = 'albums'
+
+    @classmethod
+    def get_or_create_by_name(cls, album_name, artist, defaults=None):
+        """
+        (앨범명, 아티스트)로 조회 또는 생성 (앨범명 대소문자 구분 없음)
+
+        Artists.get_or_create_by_name과 같은 규칙으로 lower(album_name)을 비교하며 (0011 인덱스 사용),
+        같은 앨범이 여러 행이면 먼저 생성된 앨범을 사용합니다.
+
+        Returns:
+            (Albums, created)
+        """
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        album = cls.objects.annotate(
+            name_key=Lower('album_name')
+        ).filter(
+            artist=artist,
+            name_key=album_name.lower()
+        ).order_by('album_id').first()
+        if album is not None:
+            return album, False
+        return cls.objects.create(album_name=album_name, artist=artist, **(defaults or {})), True
         verbose_name = '앨범'
         verbose_name_plural = '2️⃣ 🎵 MUSIC - 앨범'
 
@@ -77,6 +101,28 @@ class Artists(TrackableMixin, models.Model):
     class Meta:
         managed = False
         db_table = 'artists'
+
+    @classmethod
+    def get_or_create_by_name(cls, artist_name, defaults=None):
+        """
+        아티스트명으로 조회 또는 생성 (대소문자 구분 없음)
+
+        "IU"와 "iu"처럼 표기만 다른 이름을 같은 아티스트로 처리합니다.
+        검색 결과 연동과 같은 규칙으로 lower(artist_name)을 비교하며 (0011 인덱스 사용),
+        같은 이름이 여러 행이면 먼저 생성된 아티스트를 사용합니다.
+
+        Returns:
+            (Artists, created)
+        """
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        artist = cls.objects.annotate(
+            name_key=Lower('artist_name')
+        ).filter(
+            name_key=artist_name.lower()
+        ).order_by('artist_id').first()
+        if artist is not None:
+            return artist, False
+        return cls.objects.create(artist_name=artist_name, **(defaults or {})), True
         verbose_name = '아티스트'
         verbose_name_plural = '2️⃣ 🎵 MUSIC - 아티스트'
 
@@ -301,6 +347,7 @@ class Music(TrackableMixin, models.Model):
     valence = models.DecimalField(max_digits=10, decimal_places=6, blank=True, null=True)
     arousal = models.DecimalField(max_digits=10, decimal_places=6, blank=True, null=True)
     itunes_id = models.BigIntegerField(blank=True, null=True)
+    # tag_ids(bigint[])는 music_tags 트리거가 관리하는 DB 전용 컬럼이라 필드로 선언하지 않음 (migrations/0007)
 
     objects = SoftDeleteManager()  # 삭제되지 않은 레코드만 조회
     all_objects = models.Manager()  # 모든 레코드 (삭제된 것 포함)
@@ -381,6 +428,14 @@ class PlaylistItems(TrackableMixin, models.Model):
     class Meta:
         managed = False
         db_table = 'playlist_items'
+        constraints = [
+            # migrations/0004 부분 유니크 인덱스 (삭제되지 않은 항목 기준 곡 중복 방지)
+            models.UniqueConstraint(
+                fields=['playlist', 'music'],
+                condition=models.Q(is_deleted=False),
+                name='playlist_items_playlist_music_live_uniq',
+            ),
+        ]
         verbose_name = '플레이리스트 항목'
         verbose_name_plural = '3️⃣ 📝 PLAYLIST - 플레이리스트 항목'
 
@@ -397,6 +452,7 @@ class PlaylistLikes(TrackableMixin, models.Model):
     class Meta:
         managed = False
         db_table = 'playlist_likes'
+        unique_together = (('user', 'playlist'),)  # migrations/0002 유니크 인덱스
         verbose_name = '플레이리스트 좋아요'
         verbose_name_plural = '3️⃣ 📝 PLAYLIST - 플레이리스트 좋아요'
 
@@ -406,6 +462,7 @@ class Playlists(TrackableMixin, models.Model):
     user = models.ForeignKey('Users', models.DO_NOTHING, blank=True, null=True)
     title = models.CharField(max_length=100, blank=True, null=True)
     visibility = models.TextField(blank=True, null=True)  # This field type is a guess.
+    next_order = models.PositiveIntegerField(default=1)  # 다음 곡 추가 시 사용할 순서 (카운터)
     # created_at, updated_at, is_deleted는 TrackableMixin에서 제공
 
     objects = SoftDeleteManager()  # 삭제되지 않은 레코드만 조회
@@ -417,6 +474,32 @@ class Playlists(TrackableMixin, models.Model):
         verbose_name = '플레이리스트'
         verbose_name_plural = '3️⃣ 📝 PLAYLIST - 플레이리스트'
 
+    def allocate_item_order(self, order=None):
+        """
+        곡 추가 순서 할당
+
+        next_order 카운터 행을 잠그고 증가시켜 동시 추가 요청 간 순서 중복을 막습니다.
+        반드시 transaction.atomic() 블록 안에서 호출해야 합니다.
+
+        Args:
+            order: 직접 지정한 순서 (None이면 마지막 순서)
+
+        Returns:
+            int: 새 곡에 사용할 order 값
+        """
+        next_order = Playlists.objects.select_for_update().filter(
+            playlist_id=self.playlist_id
+        ).values_list('next_order', flat=True).get()
+
+        if order is None:
+            order = next_order
+
+        # 명시한 order가 더 크면 그 다음 값으로 맞춤 (이후 자동 순서가 항상 마지막에 오도록)
+        Playlists.objects.filter(playlist_id=self.playlist_id).update(
+            next_order=Greatest(F('next_order'), order) + 1
+        )
+        return order
+
 
 class Tags(TrackableMixin, models.Model):
     tag_id = models.BigAutoField(primary_key=True)
@@ -0,0 +1,36 @@
+"""
+커스텀 렌더러: orjson 기반 JSON 응답
+
+DRF 기본 JSONRenderer(표준 json.dumps)보다 2~3배 빠르게 직렬화합니다.
+검색 결과, 플레이리스트 목록처럼 응답 페이로드가 큰 View에서 사용합니다.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson이 기본 지원하지 않는 타입(Decimal, lazy 문자열 등)은 DRF 인코더 규칙을 그대로 따름
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    orjson으로 응답 데이터를 직렬화하는 렌더러
+
+    사용 예시:
+        class MyView(APIView):
+            renderer_classes = [ORJSONRenderer]
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """응답 데이터를 JSON bytes로 변환"""
+        if data is None:
+            return b''
+
+        return orjson.dumps(
+            data,
+            default=_drf_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
@@ -61,7 +61,6 @@ from .playlist import (
     PlaylistUpdateSerializer,
     PlaylistItemSerializer,
     PlaylistItemAddSerializer,
-    PlaylistLikeSerializer,
 )
 
 # 차트 관련 Serializers
@@ -127,7 +126,6 @@ __all__ = [
     'PlaylistUpdateSerializer',
     'PlaylistItemSerializer',
     'PlaylistItemAddSerializer',
-    'PlaylistLikeSerializer',
     # charts
     'PlayLogCreateSerializer',
     'PlayLogResponseSerializer',
@@ -1,10 +1,35 @@
 """
 기본 Serializers - 아티스트, 앨범, 태그, AI 정보
 """
+import copy
+
 from rest_framework import serializers
 from ..models import Artists, Albums, Tags, AiInfo
 
 
+class CachedFieldsMixin:
+    """
+    ModelSerializer의 필드 구성 결과를 클래스 단위로 캐싱하는 Mixin
+
+    모델 메타 정보 분석(build_field 등)은 클래스당 한 번만 수행하고,
+    이후 인스턴스는 캐시된 필드의 복사본을 바인딩해 사용합니다.
+    필드 구성이 instance/context에 따라 달라지지 않는 출력용 Serializer에만 사용하세요.
+
+    사용 예시:
+        class PlaylistSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+            ...
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # 하위 클래스가 부모 캐시를 공유하지 않도록 cls.__dict__에서 직접 조회
+        cached_fields = cls.__dict__.get('_cached_fields')
+        if cached_fields is None:
+            cached_fields = super().get_fields()
+            cls._cached_fields = cached_fields
+        return copy.deepcopy(cached_fields)
+
+
 class ArtistSerializer(serializers.ModelSerializer):
     """아티스트 정보 Serializer"""
     artist_image = serializers.SerializerMethodField()
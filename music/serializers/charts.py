@@ -3,7 +3,7 @@
 """
 from rest_framework import serializers
 from ..models import PlayLogs, Charts, Music
-from .base import ArtistSerializer, AlbumSerializer
+from .base import ArtistSerializer, AlbumSerializer, CachedFieldsMixin
 
 
 class PlayLogCreateSerializer(serializers.Serializer):
@@ -15,19 +15,20 @@ class PlayLogCreateSerializer(serializers.Serializer):
 class PlayLogResponseSerializer(serializers.Serializer):
     """재생 기록 생성 응답 Serializer"""
     message = serializers.CharField()
-    play_log_id = serializers.IntegerField()
+    play_log_id = serializers.IntegerField(allow_null=True)  # 버퍼 적재(202) 시 null
     music_id = serializers.IntegerField()
     played_at = serializers.DateTimeField()
 
 
-class PlayLogListItemSerializer(serializers.ModelSerializer):
+class PlayLogListItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """재생 로그 목록 항목 Serializer"""
-    user_id = serializers.IntegerField(source='user.user_id', read_only=True)
+    user_id = serializers.IntegerField(read_only=True)  # FK 컬럼 값을 그대로 사용 (users JOIN 불필요)
     played_at = serializers.SerializerMethodField()
     
     class Meta:
         model = PlayLogs
         fields = ['user_id', 'played_at']
+        read_only_fields = fields  # 출력 전용 (쓰기용 필드/검증기 생성 생략)
     
     def get_played_at(self, obj):
         """played_at에서 소수점(마이크로초) 제거"""
@@ -1,21 +1,24 @@
 """
 플레이리스트 관련 Serializers - 플레이리스트 CRUD, 곡 관리, 좋아요
 """
+from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery, Value
 from rest_framework import serializers
 from ..models import Playlists, PlaylistItems, PlaylistLikes, Music
+from .base import CachedFieldsMixin
 from .music import MusicPlaySerializer
 
 
-class PlaylistItemSerializer(serializers.ModelSerializer):
+class PlaylistItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """플레이리스트 항목 Serializer"""
     music = MusicPlaySerializer(read_only=True)
     
     class Meta:
         model = PlaylistItems
         fields = ['item_id', 'music', 'order', 'created_at']
+        read_only_fields = fields  # 출력 전용 (쓰기용 필드/검증기 생성 생략)
 
 
-class PlaylistSerializer(serializers.ModelSerializer):
+class PlaylistSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """플레이리스트 목록 조회용 Serializer (기본 정보만)"""
     user_id = serializers.SerializerMethodField()
     creator_nickname = serializers.SerializerMethodField()
@@ -30,10 +33,41 @@ class PlaylistSerializer(serializers.ModelSerializer):
             'item_count', 'like_count', 'is_liked',
             'created_at', 'updated_at', 
         ]
+        read_only_fields = fields  # 출력 전용 (쓰기용 필드/검증기 생성 생략)
+
+    @staticmethod
+    def setup_eager_loading(queryset, user=None):
+        """
+        목록 조회 시 N+1 쿼리 방지
+
+        생성자(user)는 JOIN으로, 곡 개수/좋아요 개수/좋아요 여부는
+        서브쿼리 annotate로 한 번에 가져옵니다.
+
+        Args:
+            queryset: Playlists QuerySet
+            user: 현재 사용자 (비로그인 시 None)
+        """
+        item_count = PlaylistItems.objects.filter(
+            playlist=OuterRef('pk')
+        ).values('playlist').annotate(c=Count('*')).values('c')
+        like_count = PlaylistLikes.objects.filter(
+            playlist=OuterRef('pk')
+        ).values('playlist').annotate(c=Count('*')).values('c')
+
+        if user is not None and getattr(user, 'is_authenticated', False):
+            is_liked = Exists(PlaylistLikes.objects.filter(playlist=OuterRef('pk'), user=user))
+        else:
+            is_liked = Value(False)
+
+        return queryset.select_related('user').annotate(
+            annotated_item_count=Subquery(item_count, output_field=IntegerField()),
+            annotated_like_count=Subquery(like_count, output_field=IntegerField()),
+            annotated_is_liked=is_liked,
+        )
     
     def get_user_id(self, obj):
         """플레이리스트 생성자 ID (안전하게 처리)"""
-        return obj.user.user_id if obj.user else None
+        return obj.user_id
     
     def get_creator_nickname(self, obj):
         """플레이리스트 생성자 닉네임 (안전하게 처리)"""
@@ -43,6 +77,8 @@ class PlaylistSerializer(serializers.ModelSerializer):
     
     def get_item_count(self, obj):
         """플레이리스트의 곡 개수"""
+        if hasattr(obj, 'annotated_item_count'):
+            return obj.annotated_item_count or 0
         return PlaylistItems.objects.filter(
             playlist=obj,
             is_deleted=False
@@ -50,6 +86,8 @@ class PlaylistSerializer(serializers.ModelSerializer):
     
     def get_like_count(self, obj):
         """플레이리스트 좋아요 개수"""
+        if hasattr(obj, 'annotated_like_count'):
+            return obj.annotated_like_count or 0
         return PlaylistLikes.objects.filter(
             playlist=obj,
             is_deleted=False
@@ -57,6 +95,9 @@ class PlaylistSerializer(serializers.ModelSerializer):
     
     def get_is_liked(self, obj):
         """현재 사용자가 좋아요를 눌렀는지 여부"""
+        if hasattr(obj, 'annotated_is_liked'):
+            return bool(obj.annotated_is_liked)
+
         request = self.context.get('request')
         if not request:
             return False
@@ -76,7 +117,7 @@ class PlaylistSerializer(serializers.ModelSerializer):
             return False
 
 
-class PlaylistDetailSerializer(serializers.ModelSerializer):
+class PlaylistDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """플레이리스트 상세 조회용 Serializer (곡 목록 포함)"""
     user_id = serializers.IntegerField(source='user.user_id', read_only=True)
     items = serializers.SerializerMethodField()
@@ -91,6 +132,7 @@ class PlaylistDetailSerializer(serializers.ModelSerializer):
             'items', 'item_count', 'like_count', 'is_liked',
             'created_at', 'updated_at'
         ]
+        read_only_fields = fields  # 출력 전용 (쓰기용 필드/검증기 생성 생략)
     
     def get_items(self, obj):
         """플레이리스트의 곡 목록 (order 순서대로)"""
@@ -188,6 +230,13 @@ class PlaylistUpdateSerializer(serializers.ModelSerializer):
                 )
         return value
 
+    def update(self, instance, validated_data):
+        """변경된 필드만 저장 (동시에 증가된 next_order 카운터를 덮어쓰지 않도록)"""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
 
 class PlaylistItemAddSerializer(serializers.Serializer):
     """플레이리스트 곡 추가용 Serializer"""
@@ -196,15 +245,7 @@ class PlaylistItemAddSerializer(serializers.Serializer):
     
     def validate_music_id(self, value):
         """음악 존재 여부 확인"""
-        try:
-            Music.objects.get(music_id=value, is_deleted=False)
-        except Music.DoesNotExist:
+        # 행 전체(가사 등) 대신 존재 여부만 조회
+        if not Music.objects.filter(music_id=value, is_deleted=False).exists():
             raise serializers.ValidationError("존재하지 않는 음악입니다.")
         return value
-
-
-class PlaylistLikeSerializer(serializers.Serializer):
-    """플레이리스트 좋아요 응답용 Serializer"""
-    message = serializers.CharField()
-    playlist_id = serializers.IntegerField()
-    is_liked = serializers.BooleanField()
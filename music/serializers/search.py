@@ -41,7 +41,7 @@ class AiMusicSearchResultSerializer(serializers.Serializer):
     duration = serializers.IntegerField(allow_null=True)
     audio_url = serializers.CharField(allow_null=True)
     is_ai = serializers.BooleanField(default=True)
-    ai_info = AiInfoSerializer(read_only=True, source='aiinfo_set.first')
+    ai_info = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField()
     
     # 포맷된 재생 시간
@@ -54,6 +54,14 @@ class AiMusicSearchResultSerializer(serializers.Serializer):
             seconds = obj.duration % 60
             return f"{minutes}:{seconds:02d}"
         return None
+    
+    def get_ai_info(self, obj):
+        """첫 번째 AI 생성 정보 (View에서 prefetch한 ai_info_list가 있으면 추가 쿼리 없이 사용)"""
+        if hasattr(obj, 'ai_info_list'):
+            ai_info = obj.ai_info_list[0] if obj.ai_info_list else None
+        else:
+            ai_info = obj.aiinfo_set.first()
+        return AiInfoSerializer(ai_info).data if ai_info else None
 
 
 class TagMusicSearchSerializer(serializers.Serializer):
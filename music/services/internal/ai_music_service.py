@@ -17,6 +17,7 @@ from django.utils import timezone
 from django.db import transaction
 
 from music.models import Music, AiInfo, Users, Artists, Albums
+from music.utils.statistics_cache import invalidate_user_statistics
 from music.music_generate.services import LlamaService, SunoAPIService
 from music.music_generate.utils import extract_genre_from_prompt
 from music.music_generate.exceptions import (
@@ -424,6 +425,10 @@ class AiMusicGenerationService:
         )
         print(f"[DB 저장] ✅ AiInfo 저장 완료: aiinfo_id={ai_info.aiinfo_id}")
         
+        # 사용자 AI 생성 통계 캐시 무효화 (커밋 후 실행해 이전 상태가 다시 캐싱되지 않도록 함)
+        if user:
+            transaction.on_commit(lambda: invalidate_user_statistics(user.user_id))
+        
         return music, artist, album, ai_info
     
     def _queue_async_tasks(
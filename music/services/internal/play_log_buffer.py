@@ -0,0 +1,176 @@
+"""
+재생 기록 쓰기 버퍼 (write-behind)
+
+재생 기록(PlayLogs)은 서비스에서 가장 호출이 많은 쓰기 작업입니다.
+REDIS_URL이 설정된 경우 요청마다 INSERT하지 않고 Redis 리스트에 적재한 뒤,
+Celery Beat 작업(flush_play_log_buffer)이 주기적으로 모아서 bulk_create 합니다.
+
+REDIS_URL이 없거나 Redis에 연결할 수 없으면 enqueue()가 False를 반환하며,
+호출 측은 기존처럼 동기 INSERT로 처리합니다.
+
+flush는 꺼낸 기록을 처리 중 리스트(PROCESSING_KEY)로 옮겨 두고 DB 저장이 끝난 뒤에만 ack()로 지우므로,
+저장 실패나 워커 종료 시에도 기록이 유실되지 않고 다음 flush에서 다시 저장됩니다. (at-least-once)
+처리 중 리스트는 하나이므로 flush_lock()으로 한 번에 하나의 flush만 실행합니다.
+같은 배치가 계속 실패하면(drain()이 반환하는 재시도 횟수 참고) flush 작업이 한 건씩 저장하고,
+저장할 수 없는 기록은 dead_letter()로 옮겨 새 기록의 저장이 막히지 않게 합니다.
+"""
+import json
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = 'playlog:queue'
+
+# flush 중인 기록 (DB 저장 후 ack()로 삭제)
+PROCESSING_KEY = 'playlog:processing'
+
+# 처리 중 리스트의 배치가 다시 처리된 횟수 (ack() 시 삭제)
+PROCESSING_ATTEMPTS_KEY = 'playlog:processing:attempts'
+
+# 저장할 수 없는 기록 (FK/데이터 오류, 운영자가 확인 후 정리)
+DEAD_LETTER_KEY = 'playlog:dead'
+
+# 동시에 하나의 flush만 실행하기 위한 락 (워커가 죽어도 timeout 후 자동 해제)
+FLUSH_LOCK_KEY = 'playlog:flush-lock'
+FLUSH_LOCK_TIMEOUT = 60
+
+_client = None
+
+
+def _get_client():
+    """Redis 클라이언트 (REDIS_URL 미설정 또는 redis 패키지 미설치 시 None)"""
+    global _client
+    if _client is not None:
+        return _client
+
+    redis_url = getattr(settings, 'REDIS_URL', '')
+    if not redis_url:
+        return None
+
+    try:
+        import redis
+    except ImportError:
+        logger.warning("[재생 기록 버퍼] redis 패키지가 설치되지 않아 동기 저장으로 처리합니다")
+        return None
+
+    _client = redis.Redis.from_url(redis_url, socket_timeout=1, socket_connect_timeout=1)
+    return _client
+
+
+def _dumps(record: Dict) -> str:
+    return json.dumps({
+        'user_id': record['user_id'],
+        'music_id': record['music_id'],
+        'played_at': record['played_at'].isoformat(),
+    })
+
+
+def enqueue(user_id: int, music_id: int, played_at: datetime) -> bool:
+    """
+    재생 기록을 버퍼에 적재합니다.
+
+    Returns:
+        적재 성공 여부 (False면 호출 측에서 동기 INSERT 필요)
+    """
+    client = _get_client()
+    if client is None:
+        return False
+
+    payload = _dumps({'user_id': user_id, 'music_id': music_id, 'played_at': played_at})
+    try:
+        client.rpush(QUEUE_KEY, payload)
+        return True
+    except Exception as e:
+        logger.warning(f"[재생 기록 버퍼] Redis 적재 실패, 동기 저장으로 처리: {str(e)}")
+        return False
+
+
+@contextmanager
+def flush_lock() -> Iterator[bool]:
+    """
+    flush 실행 락
+
+    Yields:
+        락 획득 여부 (REDIS_URL 미설정이거나 다른 flush가 실행 중이면 False)
+    """
+    client = _get_client()
+    if client is None:
+        yield False
+        return
+
+    lock = client.lock(FLUSH_LOCK_KEY, timeout=FLUSH_LOCK_TIMEOUT, blocking=False)
+    acquired = lock.acquire()
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                lock.release()
+            except Exception as e:
+                # flush가 timeout보다 오래 걸려 락이 이미 만료된 경우
+                logger.warning(f"[재생 기록 버퍼] flush 락 해제 실패: {str(e)}")
+
+
+def drain(max_items: int) -> Tuple[List[Dict], int]:
+    """
+    버퍼에서 최대 max_items개의 재생 기록을 처리 중 리스트로 옮기고 반환합니다.
+    (flush_lock()을 획득한 상태에서 호출)
+
+    이전 flush가 ack() 전에 실패/종료되어 처리 중 리스트에 남은 기록이 있으면,
+    새 기록을 꺼내지 않고 남은 기록을 먼저 반환합니다.
+
+    Returns:
+        (재생 기록 목록, 이 배치의 이전 처리 시도 횟수 - 새로 꺼낸 배치면 0)
+    """
+    client = _get_client()
+    if client is None:
+        return [], 0
+
+    raw_items = client.lrange(PROCESSING_KEY, 0, -1)
+    if raw_items:
+        attempts = client.incr(PROCESSING_ATTEMPTS_KEY)
+        logger.warning(
+            f"[재생 기록 버퍼] 이전 flush에서 저장되지 않은 기록 재처리: {len(raw_items)}개 (재시도 {attempts}회)"
+        )
+    else:
+        attempts = 0
+        # 버퍼에서 꺼내는 쪽은 락을 가진 flush뿐이므로 LLEN 이상 줄어들지 않음
+        count = min(client.llen(QUEUE_KEY), max_items)
+        if not count:
+            return [], 0
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(PROCESSING_ATTEMPTS_KEY)
+        for _ in range(count):
+            pipe.lmove(QUEUE_KEY, PROCESSING_KEY, 'LEFT', 'RIGHT')
+        raw_items = [raw for raw in pipe.execute()[1:] if raw is not None]
+
+    records = []
+    for raw in raw_items:
+        try:
+            record = json.loads(raw)
+            record['played_at'] = datetime.fromisoformat(record['played_at'])
+            records.append(record)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"[재생 기록 버퍼] 잘못된 항목 무시: {raw!r} ({str(e)})")
+    return records, attempts
+
+
+def ack() -> None:
+    """drain()으로 꺼낸 기록의 저장이 끝났음을 확인하고 처리 중 리스트를 비웁니다"""
+    client = _get_client()
+    if client is None:
+        return
+    client.delete(PROCESSING_KEY, PROCESSING_ATTEMPTS_KEY)
+
+
+def dead_letter(records: List[Dict]) -> None:
+    """저장할 수 없는 기록을 dead-letter 리스트로 옮깁니다 (ack() 전에 호출)"""
+    client = _get_client()
+    if client is None or not records:
+        return
+    client.rpush(DEAD_LETTER_KEY, *[_dumps(record) for record in records])
@@ -4,16 +4,49 @@
 PlayLogs 테이블을 기반으로 사용자별 음악 청취 통계를 제공합니다.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
-from django.db.models import Sum, Count, F, Q
+from typing import Optional, Dict, List, Any, Tuple
+from django.db import close_old_connections
+from django.db.models import Sum, Count, F, Func, IntegerField, Max, Q
 from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.timezone import is_aware, make_aware
 
 from music.models import PlayLogs, Music, MusicTags, Tags, Artists, AiInfo
 
 logger = logging.getLogger(__name__)
 
+# 전체 통계의 하위 집계(청취 시간, 장르, 아티스트, 태그, AI 생성)를 동시에 실행하기 위한 스레드 풀
+# (각 집계는 서로 독립적인 읽기 쿼리이며, 스레드마다 별도 DB 연결을 사용)
+_statistics_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix='user-statistics')
+
+
+class _TotalOverGroups(Func):
+    """
+    GROUP BY 결과 전체에 대한 집계 합계 (SUM(집계) OVER ())
+
+    윈도우 함수는 LIMIT 전에 계산되므로, Top N 행만 가져오면서
+    비율 계산용 전체 재생 횟수를 별도 COUNT 쿼리 없이 같은 쿼리에서 구합니다.
+    (PostgreSQL의 SUM(bigint)은 numeric이므로 bigint로 변환)
+    """
+    template = 'CAST(SUM(%(expressions)s) OVER () AS bigint)'
+    output_field = IntegerField()
+
+
+def _run_with_db_connection(func, *args):
+    """
+    스레드 풀에서 DB 조회 함수 실행
+
+    풀 스레드는 요청 사이클 밖에서 재사용되므로, 요청 처리와 같은 방식으로
+    작업 전후에 수명(CONN_MAX_AGE)이 지났거나 끊어진 연결을 정리합니다.
+    """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
 
 class UserStatisticsService:
     """사용자 음악 통계 서비스"""
@@ -137,15 +170,15 @@ class UserStatisticsService:
             query = query.filter(played_at__gte=start_date)
         
         # 장르별 재생 횟수 집계
+        # 전체 재생 횟수(비율 계산용)는 윈도우 함수로 같은 쿼리에서 계산
         genre_stats = query.values('music__genre').annotate(
-            play_count=Count('play_log_id')
+            play_count=Count('play_log_id'),
+            total_plays=_TotalOverGroups(Count('play_log_id'))
         ).order_by('-play_count')[:limit]
         
-        # 전체 재생 횟수
-        total_plays = query.count()
-        
         result = []
         for idx, stat in enumerate(genre_stats, 1):
+            total_plays = stat['total_plays']
             percentage = round((stat['play_count'] / total_plays * 100), 1) if total_plays > 0 else 0
             result.append({
                 'rank': idx,
@@ -197,20 +230,20 @@ class UserStatisticsService:
             query = query.filter(played_at__gte=start_date)
         
         # 아티스트별 재생 횟수 집계 (image_square와 artist_image 모두 가져오기)
+        # 전체 재생 횟수(비율 계산용)는 윈도우 함수로 같은 쿼리에서 계산
         artist_stats = query.values(
             'music__artist__artist_id',
             'music__artist__artist_name',
             'music__artist__artist_image',
             'music__artist__image_square'
         ).annotate(
-            play_count=Count('play_log_id')
+            play_count=Count('play_log_id'),
+            total_plays=_TotalOverGroups(Count('play_log_id'))
         ).order_by('-play_count')[:limit]
         
-        # 전체 재생 횟수
-        total_plays = query.count()
-        
         result = []
         for idx, stat in enumerate(artist_stats, 1):
+            total_plays = stat['total_plays']
             percentage = round((stat['play_count'] / total_plays * 100), 1) if total_plays > 0 else 0
             # image_square가 있으면 사용, 없으면 artist_image 사용
             artist_image = stat.get('music__artist__image_square') or stat.get('music__artist__artist_image')
@@ -311,36 +344,25 @@ class UserStatisticsService:
             created_at__isnull=False
         )
         
-        # 디버깅: 쿼리 로깅
-        logger.info(f"[get_ai_generation_stats] user_id={user_id}, period={period}")
-        logger.info(f"[get_ai_generation_stats] 전체 AI 음악 수: {query.count()}")
-        
         if period == 'month':
             start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
             query = query.filter(created_at__gte=start_date)
-            logger.info(f"[get_ai_generation_stats] 이번 달 시작: {start_date}")
-            logger.info(f"[get_ai_generation_stats] 이번 달 AI 음악 수: {query.count()}")
-        
-        total_generated = query.count()
         
-        # 마지막 생성 일시
-        last_music = query.order_by('-created_at').first()
-        last_generated_at = None
+        # 생성 곡 수와 마지막 생성 일시를 한 번의 집계 쿼리로 조회 (Music 객체를 만들지 않음)
+        stats = query.aggregate(
+            total_generated=Count('music_id'),
+            last_generated_at=Max('created_at')
+        )
+        total_generated = stats['total_generated']
+        last_generated_at = stats['last_generated_at']
         last_generated_days_ago = None
         
-        if last_music:
-            logger.info(f"[get_ai_generation_stats] last_music: music_id={last_music.music_id}, music_name={last_music.music_name}")
-            logger.info(f"[get_ai_generation_stats] last_music.created_at: {last_music.created_at}")
-            if hasattr(last_music, 'created_at') and last_music.created_at:
-                last_generated_at = last_music.created_at
-                # timezone-aware로 변환 (DB에 naive datetime으로 저장된 경우 대비)
-                from django.utils.timezone import make_aware, is_aware
-                if not is_aware(last_generated_at):
-                    last_generated_at = make_aware(last_generated_at)
-                delta = now - last_generated_at
-                last_generated_days_ago = delta.days
-        else:
-            logger.info(f"[get_ai_generation_stats] last_music is None")
+        if last_generated_at:
+            # timezone-aware로 변환 (DB에 naive datetime으로 저장된 경우 대비)
+            if not is_aware(last_generated_at):
+                last_generated_at = make_aware(last_generated_at)
+            delta = now - last_generated_at
+            last_generated_days_ago = delta.days
         
         return {
             'total_generated': total_generated,
@@ -393,6 +415,7 @@ class UserStatisticsService:
             query = query.filter(played_at__gte=start_date)
         
         # 음악별 재생 횟수 집계
+        # 전체 재생 횟수(비율 계산용)는 윈도우 함수로 같은 쿼리에서 계산
         track_stats = query.values(
             'music__music_id',
             'music__music_name',
@@ -402,14 +425,13 @@ class UserStatisticsService:
             'music__album__album_name',
             'music__album__album_image'
         ).annotate(
-            play_count=Count('play_log_id')
+            play_count=Count('play_log_id'),
+            total_plays=_TotalOverGroups(Count('play_log_id'))
         ).order_by('-play_count')[:limit]
         
-        # 전체 재생 횟수
-        total_plays = query.count()
-        
         result = []
         for idx, stat in enumerate(track_stats, 1):
+            total_plays = stat['total_plays']
             percentage = round((stat['play_count'] / total_plays * 100), 1) if total_plays > 0 else 0
             result.append({
                 'rank': idx,
@@ -434,66 +456,70 @@ class UserStatisticsService:
     ) -> Dict[str, Any]:
         """
         사용자의 전체 음악 분석 데이터를 반환합니다.
+        (조회에 실패한 통계는 기본값으로 대체, 실패 목록이 필요하면 get_full_statistics_with_failures 사용)
+        
+        Args:
+            user_id: 사용자 ID
+            period: 기간 ('month' = 이번 달, 'all' = 전체)
+        """
+        result, _ = cls.get_full_statistics_with_failures(user_id, period)
+        return result
+    
+    @classmethod
+    def get_full_statistics_with_failures(
+        cls,
+        user_id: int,
+        period: str = 'month'
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        사용자의 전체 음악 분석 데이터와 기본값으로 대체된 통계 키 목록을 반환합니다.
         
         Args:
             user_id: 사용자 ID
             period: 기간 ('month' = 이번 달, 'all' = 전체)
         
         Returns:
-            {
+            ({
                 'listening_time': {...},
                 'top_genres': [...],
                 'top_artists': [...],
                 'top_tags': [...],
                 'ai_generation': {...}
-            }
+            }, ['top_tags', ...])
         """
-        # 각 통계를 개별적으로 조회하고, 에러 발생 시 기본값 사용
-        result = {}
-        
-        # 청취 시간 통계
-        try:
-            result['listening_time'] = cls.get_listening_time(user_id, period)
-        except Exception as e:
-            logger.error(f"[get_listening_time] 오류: user_id={user_id}, error={e}", exc_info=True)
-            result['listening_time'] = {
+        # 각 통계는 서로 독립적이므로 스레드 풀에서 동시에 조회 (응답 시간 = 가장 느린 집계 시간)
+        # 에러 발생 시 해당 통계만 기본값 사용
+        sub_statistics = [
+            # (결과 키, 조회 함수, 에러 시 기본값)
+            ('listening_time', cls.get_listening_time, {
                 'total_seconds': 0,
                 'total_hours': 0.0,
                 'play_count': 0,
                 'previous_period_hours': 0.0,
                 'change_percent': 0.0
-            }
-        
-        # Top 장르
-        try:
-            result['top_genres'] = cls.get_top_genres(user_id, period)
-        except Exception as e:
-            logger.error(f"[get_top_genres] 오류: user_id={user_id}, error={e}", exc_info=True)
-            result['top_genres'] = []
-        
-        # Top 아티스트
-        try:
-            result['top_artists'] = cls.get_top_artists(user_id, period)
-        except Exception as e:
-            logger.error(f"[get_top_artists] 오류: user_id={user_id}, error={e}", exc_info=True)
-            result['top_artists'] = []
-        
-        # Top 태그
-        try:
-            result['top_tags'] = cls.get_top_tags(user_id, period)
-        except Exception as e:
-            logger.error(f"[get_top_tags] 오류: user_id={user_id}, error={e}", exc_info=True)
-            result['top_tags'] = []
-        
-        # AI 생성 통계
-        try:
-            result['ai_generation'] = cls.get_ai_generation_stats(user_id, period)
-        except Exception as e:
-            logger.error(f"[get_ai_generation_stats] 오류: user_id={user_id}, error={e}", exc_info=True)
-            result['ai_generation'] = {
+            }),
+            ('top_genres', cls.get_top_genres, []),
+            ('top_artists', cls.get_top_artists, []),
+            ('top_tags', cls.get_top_tags, []),
+            ('ai_generation', cls.get_ai_generation_stats, {
                 'total_generated': 0,
                 'last_generated_at': None,
                 'last_generated_days_ago': None
-            }
+            }),
+        ]
+        futures = [
+            (key, func, default, _statistics_executor.submit(_run_with_db_connection, func, user_id, period))
+            for key, func, default in sub_statistics
+        ]
         
-        return result
+        result = {}
+        failed_keys = []
+        for key, func, default, future in futures:
+            try:
+                result[key] = future.result()
+            except Exception as e:
+                logger.error(f"[{func.__name__}] 오류: user_id={user_id}, error={e}", exc_info=True)
+                result[key] = default
+                failed_keys.append(key)
+        
+        return result, failed_keys
@@ -5,11 +5,12 @@ Django Signals for automatic image processing and user setup
 사용자가 회원가입하면 자동으로 기본 플레이리스트를 생성합니다.
 """
 import logging
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.db import transaction
 from django.utils import timezone
-from .models import Albums, Artists, Users, Playlists
+from .models import Albums, Artists, Users, Playlists, MusicTags
+from .utils.music_tag_cache import invalidate_music_tags
 
 logger = logging.getLogger(__name__)
 
@@ -185,3 +186,14 @@ def create_default_playlist(sender, instance, created, **kwargs):
     
     # DB transaction이 완료된 후 실행
     transaction.on_commit(create_playlist)
+
+
+@receiver(post_save, sender=MusicTags)
+@receiver(post_delete, sender=MusicTags)
+def music_tags_changed(sender, instance, **kwargs):
+    """
+    음악 태그가 추가/수정/삭제되면 해당 곡의 태그 캐시 삭제
+    
+    - 추천 API가 사용하는 music_tags:{music_id} 캐시 무효화
+    """
+    invalidate_music_tags(instance.music_id)
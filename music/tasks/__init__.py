@@ -40,6 +40,11 @@ from .cleanup import (
     cleanup_old_realtime_charts,
 )
 
+# 재생 기록 작업
+from .playlogs import (
+    flush_play_log_buffer,
+)
+
 # 이미지 리사이징 작업
 from .image_resize import (
     resize_image_task,
@@ -66,6 +71,8 @@ __all__ = [
     # 정리
     'cleanup_old_playlogs',
     'cleanup_old_realtime_charts',
+    # 재생 기록
+    'flush_play_log_buffer',
     # 이미지 리사이징
     'resize_image_task',
 ]
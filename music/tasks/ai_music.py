@@ -9,6 +9,7 @@ from ..models import Music, AiInfo, Users, Artists, Albums
 from ..music_generate.services import LlamaService, SunoAPIService
 from ..music_generate.utils import extract_genre_from_prompt
 from ..utils.s3_upload import download_and_upload_to_s3, is_suno_url, is_s3_url, upload_image_to_s3
+from ..utils.statistics_cache import invalidate_user_statistics
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +192,10 @@ def generate_music_task(self, user_prompt: str, user_id: int = None, make_instru
             is_deleted=False
         )
 
+        # 사용자 AI 생성 통계 캐시 무효화
+        if user:
+            invalidate_user_statistics(user.user_id)
+
         # 8. S3 업로드 태스크 호출 (비동기)
         if audio_url and is_suno_url(audio_url):
             try:
@@ -69,13 +69,13 @@ def save_itunes_track_to_db_task(self, itunes_data: dict):
         # 트랜잭션으로 묶어서 전체 저장 성공 또는 전체 실패 보장
         with transaction.atomic():
             # Artist 생성 또는 조회
-            # - 같은 이름의 아티스트가 있으면 재사용
+            # - 같은 이름의 아티스트가 있으면 재사용 (대소문자 구분 없음)
             # - 없으면 새로 생성
             artist = None
             artist_name = itunes_data.get('artist_name', '')
             if artist_name:
-                artist, created = Artists.objects.get_or_create(
-                    artist_name=artist_name,
+                artist, created = Artists.get_or_create_by_name(
+                    artist_name,
                     defaults={
                         'artist_image': '',  # 비동기로 수집
                         'created_at': now,
@@ -95,14 +95,14 @@ def save_itunes_track_to_db_task(self, itunes_data: dict):
                         logger.warning(f"[iTunes 저장] 아티스트 이미지 태스크 호출 실패: {e}")
             
             # Album 생성 또는 조회
-            # - 같은 아티스트의 같은 앨범이 있으면 재사용
+            # - 같은 아티스트의 같은 앨범이 있으면 재사용 (앨범명 대소문자 구분 없음)
             # - 없으면 새로 생성
             album = None
             album_name = itunes_data.get('album_name', '')
             if album_name and artist:
-                album, created = Albums.objects.get_or_create(
-                    album_name=album_name,
-                    artist=artist,
+                album, created = Albums.get_or_create_by_name(
+                    album_name,
+                    artist,
                     defaults={
                         'album_image': '',  # 비동기로 수집
                         'created_at': now,
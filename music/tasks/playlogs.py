@@ -0,0 +1,110 @@
+"""
+재생 기록 관련 Celery 작업
+"""
+import logging
+from celery import shared_task
+from django.db import DataError, IntegrityError, transaction
+
+from ..models import Music, PlayLogs, Users
+from ..services.internal import play_log_buffer
+from ..utils.statistics_cache import invalidate_user_statistics
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 flush에서 꺼낼 최대 기록 수
+FLUSH_MAX_ITEMS = 5000
+
+# 같은 배치를 일괄 저장으로 재시도하는 최대 횟수 (초과 시 한 건씩 저장하고 실패한 기록은 dead-letter로 이동)
+FLUSH_MAX_ATTEMPTS = 3
+
+
+def _build_play_log(record):
+    # created_at/updated_at은 auto_now 필드라 bulk_create에서도 자동으로 채워짐
+    return PlayLogs(
+        user_id=record['user_id'],
+        music_id=record['music_id'],
+        played_at=record['played_at'],
+    )
+
+
+def _save_one_by_one(records):
+    """
+    기록을 한 건씩 저장하고, 저장할 수 없는 기록(FK/데이터 오류)은 dead-letter로 옮김
+    (DB 연결 오류 등 다른 예외는 그대로 전파하여 다음 주기에 재시도)
+
+    Returns:
+        저장된 기록 목록
+    """
+    saved_records = []
+    dead_records = []
+    for record in records:
+        try:
+            with transaction.atomic():
+                _build_play_log(record).save()
+            saved_records.append(record)
+        except (IntegrityError, DataError) as e:
+            logger.error(f"[재생 기록 flush] 저장할 수 없는 기록을 dead-letter로 이동: {record} ({str(e)})")
+            dead_records.append(record)
+    play_log_buffer.dead_letter(dead_records)
+    return saved_records
+
+
+@shared_task(name='music.tasks.flush_play_log_buffer', ignore_result=True)
+def flush_play_log_buffer():
+    """
+    Redis 버퍼에 쌓인 재생 기록을 DB에 일괄 저장 (5초마다 실행)
+    - REDIS_URL 미설정 시 아무 작업도 하지 않음
+    - 저장에 실패하면 기록이 처리 중 리스트에 남아 다음 주기에 다시 저장
+    """
+    with play_log_buffer.flush_lock() as acquired:
+        if not acquired:
+            return {"status": "skipped", "created_count": 0}
+
+        records, attempts = play_log_buffer.drain(FLUSH_MAX_ITEMS)
+        if not records:
+            # 잘못된 항목만 꺼낸 경우에도 처리 중 리스트를 비움
+            play_log_buffer.ack()
+            return {"status": "success", "created_count": 0}
+
+        try:
+            # 존재하지 않거나 삭제된 음악/사용자의 기록은 제외 (동기 저장 경로와 같은 규칙)
+            # (잘못된 ID 하나 때문에 배치 전체가 FK 위반으로 실패하는 것을 방지)
+            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+            valid_music_ids = set(
+                Music.objects.filter(
+                    music_id__in={record['music_id'] for record in records}
+                ).values_list('music_id', flat=True)
+            )
+            valid_user_ids = set(
+                Users.objects.filter(
+                    user_id__in={record['user_id'] for record in records}
+                ).values_list('user_id', flat=True)
+            )
+            valid_records = [
+                record for record in records
+                if record['music_id'] in valid_music_ids and record['user_id'] in valid_user_ids
+            ]
+            skipped_count = len(records) - len(valid_records)
+            if skipped_count:
+                logger.warning(f"[재생 기록 flush] 존재하지 않거나 삭제된 음악/사용자의 기록 제외: {skipped_count}개")
+
+            if attempts >= FLUSH_MAX_ATTEMPTS:
+                # 같은 배치가 계속 실패하면 문제 기록 때문에 새 기록까지 막히지 않도록 한 건씩 저장
+                valid_records = _save_one_by_one(valid_records)
+            else:
+                PlayLogs.objects.bulk_create(
+                    [_build_play_log(record) for record in valid_records],
+                    batch_size=1000,
+                )
+        except Exception as e:
+            logger.error(f"[재생 기록 flush] 오류, 다음 주기에 재시도: {str(e)}")
+            raise
+
+        # DB 저장이 끝난 뒤에만 처리 중 리스트에서 삭제
+        play_log_buffer.ack()
+
+    if valid_records:
+        # 새 재생 기록이 저장된 사용자들의 통계 캐시 무효화
+        invalidate_user_statistics(*{record['user_id'] for record in valid_records})
+        logger.info(f"[재생 기록 flush] 저장 완료: {len(valid_records)}개")
+    return {"status": "success", "created_count": len(valid_records)}
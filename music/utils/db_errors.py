@@ -0,0 +1,16 @@
+"""
+DB 제약 위반 판별 유틸리티
+
+INSERT 한 번으로 중복을 판단하는 곳에서, IntegrityError 중 특정 유니크 인덱스 위반만
+"이미 존재함"으로 처리하고 FK 위반 등 다른 제약 위반은 그대로 전파하기 위해 사용합니다.
+"""
+from django.db import IntegrityError
+
+# 플레이리스트 항목 (playlist_id, music_id) 부분 유니크 인덱스 (0004 마이그레이션)
+PLAYLIST_ITEM_UNIQUE_CONSTRAINT = 'playlist_items_playlist_music_live_uniq'
+
+
+def is_constraint_violation(exc: IntegrityError, constraint_name: str) -> bool:
+    """IntegrityError가 지정한 제약/인덱스 위반인지 확인 (psycopg2 오류의 diag.constraint_name 기준)"""
+    diag = getattr(exc.__cause__, 'diag', None)
+    return getattr(diag, 'constraint_name', None) == constraint_name
@@ -0,0 +1,68 @@
+"""
+음악별 태그 ID 집합 캐시 유틸리티
+
+추천 API는 기준 곡과 후보 곡들의 태그 집합을 요청마다 다시 조회합니다.
+곡의 태그는 거의 바뀌지 않으므로 music_tags:{music_id} 키에 태그 ID 목록을 캐싱하고,
+여러 곡을 get_many 한 번으로 읽은 뒤 캐시에 없는 곡만 DB에서 일괄 조회합니다.
+
+MusicTags 저장/삭제 시 signals.py에서 해당 곡의 캐시를 삭제합니다.
+(외부 파이프라인에서 직접 변경한 경우를 위해 TTL도 함께 둡니다)
+"""
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable
+
+from django.core.cache import cache
+
+from ..models import MusicTags
+
+# 태그 캐시 유지 시간 (초)
+MUSIC_TAGS_CACHE_TTL = 60 * 60
+
+# 캐시에 없는 곡의 태그를 DB에서 읽을 때 한 번에 가져오는 행 수
+TAG_FETCH_CHUNK_SIZE = 2000
+
+
+def _cache_key(music_id: int) -> str:
+    return f'music_tags:{music_id}'
+
+
+def get_tags_for(music_ids: Iterable[int]) -> Dict[int, FrozenSet[int]]:
+    """
+    여러 곡의 태그 ID 집합 조회
+
+    Args:
+        music_ids: 음악 ID 목록
+
+    Returns:
+        {music_id: frozenset(tag_id, ...)} (태그가 없는 곡은 빈 frozenset)
+    """
+    keys = {_cache_key(music_id): music_id for music_id in music_ids}
+    if not keys:
+        return {}
+
+    cached = cache.get_many(list(keys))
+    tags_by_music = {keys[key]: frozenset(tag_ids) for key, tag_ids in cached.items()}
+
+    missing_ids = [music_id for music_id in keys.values() if music_id not in tags_by_music]
+    if missing_ids:
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        # 결과를 리스트로 한 번에 만들지 않고 청크 단위로 읽어 집합에 바로 누적
+        fetched = defaultdict(set)
+        for music_id, tag_id in MusicTags.objects.filter(
+            music_id__in=missing_ids
+        ).values_list('music_id', 'tag_id').iterator(chunk_size=TAG_FETCH_CHUNK_SIZE):
+            fetched[music_id].add(tag_id)
+
+        cache.set_many(
+            {_cache_key(music_id): sorted(fetched[music_id]) for music_id in missing_ids},
+            MUSIC_TAGS_CACHE_TTL
+        )
+        for music_id in missing_ids:
+            tags_by_music[music_id] = frozenset(fetched[music_id])
+
+    return tags_by_music
+
+
+def invalidate_music_tags(music_id: int) -> None:
+    """곡의 태그 캐시 삭제"""
+    cache.delete(_cache_key(music_id))
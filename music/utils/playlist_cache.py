@@ -0,0 +1,37 @@
+"""
+플레이리스트 목록 응답 캐시 유틸리티
+
+사용자별 목록 응답(페이지네이션 포함)을 짧은 TTL로 캐싱합니다.
+캐시 키에 사용자별 버전 번호를 포함하여, 쓰기 작업 시 버전만 올리면
+해당 사용자의 모든 목록 캐시가 한 번에 무효화됩니다.
+(버전 관리는 versioned_cache 참고)
+"""
+from urllib.parse import urlencode
+
+from .versioned_cache import bump_cache_versions, get_cache_version
+
+# 목록 캐시 유지 시간 (초)
+PLAYLIST_LIST_CACHE_TTL = 30
+
+
+def _version_key(user_id: int) -> str:
+    return f'playlists:list:{user_id}:version'
+
+
+def get_list_cache_key(user_id: int, scope: str, query_params) -> str:
+    """
+    목록 캐시 키 생성
+
+    Args:
+        user_id: 요청 사용자 ID
+        scope: 목록 종류 (all, liked)
+        query_params: request.query_params (필터/페이지 파라미터)
+    """
+    version = get_cache_version(_version_key(user_id))
+    query = urlencode(sorted(query_params.items()))
+    return f'playlists:list:{user_id}:v{version}:{scope}:{query}'
+
+
+def invalidate_user_playlist_lists(*user_ids: int) -> None:
+    """사용자들의 플레이리스트 목록 캐시 무효화 (버전 증가)"""
+    bump_cache_versions((_version_key(user_id) for user_id in user_ids), '플레이리스트 캐시')
@@ -0,0 +1,107 @@
+"""
+사용자 통계 응답 캐시 유틸리티
+
+통계 API는 요청마다 PlayLogs 전체를 집계하지만, 결과는 재생 기록이 쌓일 때만 바뀝니다.
+직렬화된 응답(serializer.data)을 (사용자, 통계 종류, 기간, limit) 단위로 짧은 TTL로 캐싱하여
+반복 요청 시 집계 쿼리와 직렬화를 모두 생략합니다.
+
+캐시 키에 사용자별 버전 번호를 포함하여, 재생 기록 저장/AI 곡 생성 시 버전만 올리면
+해당 사용자의 모든 통계 캐시가 한 번에 무효화됩니다.
+(버전 관리는 versioned_cache 참고)
+
+캐시가 비어 있을 때 같은 통계를 동시에 요청하면(대시보드 새로고침 등) 요청마다 집계하지 않도록,
+같은 프로세스 안에서는 한 스레드만 집계하고 나머지는 그 결과를 기다립니다. (single-flight)
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from django.core.cache import cache
+
+from .versioned_cache import bump_cache_versions, get_cache_ttl, get_cache_version
+
+# 통계 캐시 유지 시간 (초)
+STATISTICS_CACHE_TTL = 60 * 5
+
+# 다른 요청의 집계 결과를 기다리는 최대 시간 (초)
+SINGLE_FLIGHT_TIMEOUT = 30
+
+# 진행 중인 집계 (캐시 키 -> 결과 Future)
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+class UncachedResult:
+    """
+    캐싱하지 않고 이번 응답에만 사용할 compute() 결과
+
+    일부 집계가 실패해 기본값으로 대체된 결과를 TTL 동안 '데이터 없음'으로 재사용하지 않기 위해 사용합니다.
+    """
+
+    def __init__(self, data: Any):
+        self.data = data
+
+
+def _version_key(user_id: int) -> str:
+    return f'stats:{user_id}:version'
+
+
+def get_statistics_cache_key(user_id: int, name: str, period: str, limit: Optional[int] = None) -> str:
+    """
+    통계 캐시 키 생성
+
+    Args:
+        user_id: 통계 대상 사용자 ID
+        name: 통계 종류 (full, listening_time, genres, artists, tags, tracks, ai_generation)
+        period: 조회 기간 (month, all)
+        limit: Top N 개수 (Top N 통계가 아니면 None)
+    """
+    version = get_cache_version(_version_key(user_id))
+    return f'stats:{user_id}:v{version}:{name}:{period}:{limit}'
+
+
+def invalidate_user_statistics(*user_ids: int) -> None:
+    """사용자들의 통계 캐시 무효화 (버전 증가)"""
+    bump_cache_versions((_version_key(user_id) for user_id in user_ids), '통계 캐시')
+
+
+def get_or_compute_statistics(cache_key: str, compute: Callable[[], Any]) -> Any:
+    """
+    캐시된 통계를 반환하고, 없으면 compute() 결과를 캐싱하여 반환
+
+    같은 캐시 키의 집계가 이미 진행 중이면 새로 집계하지 않고 그 결과를 기다립니다.
+    (집계 중 발생한 예외는 기다리던 요청에도 그대로 전달)
+
+    Args:
+        cache_key: get_statistics_cache_key()로 만든 캐시 키
+        compute: 응답 데이터(직렬화된 dict/list)를 만드는 함수
+                 (캐싱하면 안 되는 결과는 UncachedResult로 감싸서 반환)
+    """
+    cached_data = cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[cache_key] = future
+
+    if not is_owner:
+        return future.result(timeout=SINGLE_FLIGHT_TIMEOUT)
+
+    try:
+        data = compute()
+        if isinstance(data, UncachedResult):
+            data = data.data
+        else:
+            cache.set(cache_key, data, get_cache_ttl(STATISTICS_CACHE_TTL))
+        future.set_result(data)
+        return data
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[cache_key]
@@ -0,0 +1,55 @@
+"""
+사용자별 버전 번호 기반 캐시 무효화 유틸리티
+
+캐시 키에 사용자별 버전 번호를 포함하고, 쓰기 작업 시 버전만 올려
+해당 사용자의 캐시를 한 번에 무효화합니다.
+(delete_pattern 같은 백엔드 전용 기능 없이 LocMem/Redis 모두에서 동작)
+"""
+import logging
+from typing import Iterable
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+logger = logging.getLogger(__name__)
+
+# 버전 키는 데이터 캐시보다 오래 유지 (만료되면 버전이 1로 돌아가 이전 캐시가 재사용될 수 있음)
+VERSION_TTL = 60 * 60 * 24
+
+# 프로세스별 캐시(LocMem)에서는 다른 워커/Celery의 버전 증가가 보이지 않으므로 이 시간 이상 캐싱하지 않음 (초)
+LOCAL_CACHE_MAX_TTL = 5
+
+
+def get_cache_ttl(ttl: int) -> int:
+    """
+    버전 기반 캐시의 실제 TTL
+
+    무효화는 캐시가 모든 프로세스에 공유될 때(REDIS_URL 설정)만 전파되므로,
+    LocMem 캐시에서는 오래된 응답이 길게 남지 않도록 TTL을 짧게 제한합니다.
+    """
+    if isinstance(caches['default'], LocMemCache):
+        return min(ttl, LOCAL_CACHE_MAX_TTL)
+    return ttl
+
+
+def get_cache_version(version_key: str) -> int:
+    """현재 캐시 버전 조회 (버전 키가 없으면 1)"""
+    return cache.get(version_key, 1)
+
+
+def bump_cache_versions(version_keys: Iterable[str], label: str) -> None:
+    """
+    캐시 버전 증가 (해당 버전을 포함한 기존 캐시 키 전체 무효화)
+
+    Args:
+        version_keys: 올릴 버전 키 목록
+        label: 실패 로그에 표시할 캐시 이름 (예: 통계 캐시)
+    """
+    for key in version_keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 버전 키가 없으면 새로 생성 (기본 버전 1 다음 값)
+            cache.set(key, 2, VERSION_TTL)
+        except Exception as e:
+            logger.warning(f"[{label}] 무효화 실패 (key={key}): {str(e)}")
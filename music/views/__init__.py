@@ -6,6 +6,9 @@ Music 앱의 Views 패키지
 # 공통 유틸리티 및 템플릿 뷰
 from .common import (
     MusicPagination, 
+    PlaylistPagination,
+    PlayLogPagination,
+    TagSearchPagination,
     ErrorTestView, 
     DatabaseQueryTestView,
     music_generator_page,
@@ -80,6 +83,9 @@ from .recommendations import MusicRecommendationView
 __all__ = [
     # common
     'MusicPagination',
+    'PlaylistPagination',
+    'PlayLogPagination',
+    'TagSearchPagination',
     'ErrorTestView',
     'DatabaseQueryTestView',
     # auth
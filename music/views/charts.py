@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse, OpenApiExample
 from django.utils.timezone import localtime
+from django.db.models import Max
 
 from ..models import Charts
 from ..serializers import ChartItemSerializer, ChartResponseSerializer
@@ -114,9 +115,12 @@ class ChartView(APIView):
         
         # 2. 최신 차트 날짜 조회
         # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        latest_chart = Charts.objects.filter(type=type).order_by('-chart_date').first()
+        # 행 전체 대신 MAX(chart_date) 값 하나만 조회
+        latest_chart_date = Charts.objects.filter(type=type).aggregate(
+            latest=Max('chart_date')
+        )['latest']
         
-        if not latest_chart:
+        if latest_chart_date is None:
             return Response(
                 {"detail": f"'{type}' 차트 데이터가 없습니다"},
                 status=status.HTTP_404_NOT_FOUND
@@ -129,7 +133,7 @@ class ChartView(APIView):
             music__is_deleted=False  # 삭제된 음악 제외
         ).extra(
             where=["chart_date::text = %s::text"],
-            params=[str(latest_chart.chart_date)]
+            params=[str(latest_chart_date)]
         ).select_related(
             'music',
             'music__artist',
@@ -137,21 +141,21 @@ class ChartView(APIView):
         ).order_by('rank')
         
         # 4. 이전 차트 조회 (순위 변동 계산용)
-        previous_chart = Charts.objects.filter(
+        previous_chart_date = Charts.objects.filter(
             type=type,
-            chart_date__lt=latest_chart.chart_date,
+            chart_date__lt=latest_chart_date,
             is_deleted=False
-        ).order_by('-chart_date').first()
+        ).aggregate(previous=Max('chart_date'))['previous']
         
         previous_ranks = {}
-        if previous_chart:
+        if previous_chart_date is not None:
             # 이전 차트의 순위 정보를 {music_id: rank} 딕셔너리로 구성
             previous_items = Charts.objects.filter(
                 type=type,
                 music__is_deleted=False  # 삭제된 음악 제외
             ).extra(
                 where=["chart_date::text = %s::text"],
-                params=[str(previous_chart.chart_date)]
+                params=[str(previous_chart_date)]
             ).values('music_id', 'rank')
 
             previous_ranks = {item['music_id']: item['rank'] for item in previous_items}
@@ -168,7 +172,7 @@ class ChartView(APIView):
         # 6. 응답 구성
         response_data = {
             "type": type,
-            "generated_at": latest_chart.chart_date,
+            "generated_at": latest_chart_date,
             "total_count": chart_items.count(),
             "items": ChartItemSerializer(chart_items, many=True).data
         }
@@ -46,6 +46,27 @@ class MusicPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class PlaylistPagination(PageNumberPagination):
+    """플레이리스트 목록 페이지네이션"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class PlayLogPagination(PageNumberPagination):
+    """재생 로그 목록 페이지네이션 (인기곡은 로그가 매우 많으므로 상한 필수)"""
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class TagSearchPagination(PageNumberPagination):
+    """태그 검색 결과 페이지네이션 (결과가 최대 150곡이므로 한 페이지에 전체 조회 가능)"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 150
+
+
 class ErrorTestView(APIView):
     """
     에러율 테스트용 엔드포인트
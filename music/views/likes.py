@@ -6,9 +6,12 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
+from django.db import IntegrityError, transaction
 from drf_spectacular.utils import extend_schema
 from ..models import Music, MusicLikes, Users, Playlists, PlaylistItems, Albums, AlbumLikes
 from ..serializers import MusicLikeSerializer, UserLikedMusicSerializer, AlbumLikeSerializer, UserLikedAlbumSerializer
+from ..utils.db_errors import PLAYLIST_ITEM_UNIQUE_CONSTRAINT, is_constraint_violation
+from ..utils.playlist_cache import invalidate_user_playlist_lists
 
 
 class MusicLikeView(APIView):
@@ -84,33 +87,28 @@ class MusicLikeView(APIView):
                 ).first()
 
                 if system_playlist:
-                    # 이미 플레이리스트에 추가되어 있는지 확인
-                    existing_item = PlaylistItems.objects.filter(
-                        playlist=system_playlist,
-                        music=music
-                    ).first()
-
-                    if not existing_item:
-                        # 마지막 순서 계산
-                        last_item = PlaylistItems.objects.filter(
-                            playlist=system_playlist
-                        ).order_by('-order').first()
-
-                        next_order = (last_item.order + 1) if last_item else 1
+                    with transaction.atomic():
+                        # 마지막 순서 할당 (next_order 카운터 사용, 마지막 행 조회 불필요)
+                        next_order = system_playlist.allocate_item_order()
 
                         # 시스템 플레이리스트에 곡 추가
+                        # 이미 추가된 곡이면 부분 유니크 인덱스 위반으로 롤백 (아래 예외 처리)
                         PlaylistItems.objects.create(
                             playlist=system_playlist,
                             music=music,
                             order=next_order
                         )
+                    invalidate_user_playlist_lists(user.user_id)
             except Exception as e:
-                # 시스템 플레이리스트 추가 실패해도 좋아요는 정상 처리
-                import logging
-                logging.getLogger(__name__).warning(
-                    f"시스템 플레이리스트 추가 실패: user_id={user.user_id}, "
-                    f"music_id={music_id}, error={e}"
-                )
+                # 이미 시스템 플레이리스트에 있는 곡(부분 유니크 인덱스 위반)은 무시
+                is_duplicate = isinstance(e, IntegrityError) and is_constraint_violation(e, PLAYLIST_ITEM_UNIQUE_CONSTRAINT)
+                if not is_duplicate:
+                    # 시스템 플레이리스트 추가 실패해도 좋아요는 정상 처리 (FK 위반 등 다른 오류는 기록)
+                    import logging
+                    logging.getLogger(__name__).warning(
+                        f"시스템 플레이리스트 추가 실패: user_id={user.user_id}, "
+                        f"music_id={music_id}, error={e}"
+                    )
 
         # 좋아요 개수 조회
         like_count = MusicLikes.objects.filter(music=music).count()
@@ -172,6 +170,7 @@ class MusicLikeView(APIView):
 
                     if playlist_item:
                         playlist_item.delete()
+                        invalidate_user_playlist_lists(user.user_id)
             except Exception as e:
                 # 시스템 플레이리스트 제거 실패해도 좋아요 취소는 정상 처리
                 import logging
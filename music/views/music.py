@@ -43,10 +43,10 @@ class MusicDetailView(APIView):
         artist_created = False
         
         if artist_name:
-            # Artist 생성/조회 (이미지는 비동기로 수집하므로 빈 값으로 저장)
+            # Artist 생성/조회 (대소문자만 다른 이름은 같은 아티스트, 이미지는 비동기로 수집하므로 빈 값으로 저장)
             # TrackableMixin이 자동으로 created_at, is_deleted 설정
-            artist, artist_created = Artists.objects.get_or_create(
-                artist_name=artist_name,
+            artist, artist_created = Artists.get_or_create_by_name(
+                artist_name,
                 defaults={
                     'artist_image': '',  # Wikidata에서 비동기로 수집
                 }
@@ -58,9 +58,9 @@ class MusicDetailView(APIView):
         album_created = False
         if album_name and artist:
             # TrackableMixin이 자동으로 created_at, is_deleted 설정
-            album, album_created = Albums.objects.get_or_create(
-                album_name=album_name,
-                artist=artist,
+            album, album_created = Albums.get_or_create_by_name(
+                album_name,
+                artist,
                 defaults={
                     'album_image': '',  # 비동기로 수집
                 }
@@ -10,6 +10,7 @@ from drf_spectacular.types import OpenApiTypes
 from ..services.opensearch import opensearch_service
 from ..services.recommend_client import recommendation_client
 from ..serializers import iTunesSearchResultSerializer
+from ..renderers import ORJSONRenderer
 from .common import MusicPagination
 
 
@@ -26,6 +27,7 @@ class OpenSearchMusicSearchView(APIView):
     """
     permission_classes = [AllowAny]
     pagination_class = MusicPagination
+    renderer_classes = [ORJSONRenderer]  # 대용량 검색 결과 직렬화 (orjson)
     
     @extend_schema(
         summary="OpenSearch 음악 검색",
@@ -1,11 +1,13 @@
 """
 플레이리스트 관련 Views - 플레이리스트 CRUD, 곡 관리, 좋아요
 """
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from drf_spectacular.utils import extend_schema
 from ..models import Playlists, PlaylistItems, PlaylistLikes, Music, Users
@@ -14,13 +16,40 @@ from ..serializers.playlist import (
     PlaylistDetailSerializer,
     PlaylistCreateSerializer,
     PlaylistUpdateSerializer,
-    PlaylistItemSerializer,
     PlaylistItemAddSerializer,
-    PlaylistLikeSerializer,
 )
+from ..renderers import ORJSONRenderer
+from ..utils.playlist_cache import (
+    PLAYLIST_LIST_CACHE_TTL,
+    get_list_cache_key,
+    invalidate_user_playlist_lists,
+)
+from ..utils.db_errors import PLAYLIST_ITEM_UNIQUE_CONSTRAINT, is_constraint_violation
+from ..utils.versioned_cache import get_cache_ttl
+from .common import PlaylistPagination
+
 
+def _get_owned_playlist(request, playlist_id, only=None):
+    """
+    요청 사용자가 소유한 플레이리스트 조회 (없거나 타인의 플레이리스트면 404)
 
-# 헬퍼 함수는 제거하고 request.user를 직접 사용합니다 (likes.py와 동일한 방식)
+    소유자 조건을 쿼리에 포함하여 조회 1번으로 존재 여부와 권한을 함께 확인합니다.
+
+    Args:
+        only: 조회할 컬럼 목록 (응답에 전체 정보가 필요 없는 경우 지정)
+    """
+    # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+    queryset = Playlists.objects.all()
+    if only:
+        queryset = queryset.only(*only)
+    return get_object_or_404(queryset, playlist_id=playlist_id, user=request.user)
+
+
+# 권한/상태 확인에만 필요한 플레이리스트 컬럼
+PLAYLIST_PERMISSION_FIELDS = ('playlist_id', 'user_id', 'visibility')
+
+# 곡 추가 응답의 created_at을 PlaylistItemSerializer와 같은 형식으로 변환하기 위한 필드
+_datetime_field = serializers.DateTimeField()
 
 
 @extend_schema(tags=['플레이리스트'])
@@ -32,6 +61,8 @@ class PlaylistListCreateView(APIView):
     - POST: 플레이리스트 생성
     """
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer]  # 플레이리스트 목록이 클 수 있으므로 orjson 사용
+    pagination_class = PlaylistPagination
     
     def get(self, request):
         """
@@ -41,7 +72,15 @@ class PlaylistListCreateView(APIView):
         Query Parameters:
         - visibility: public/private (선택)
         - user_id: 특정 사용자의 플레이리스트만 조회 (선택)
+        - page, page_size: 페이지네이션 (기본 20개, 최대 100개)
+
+        응답은 사용자/쿼리 파라미터별로 30초간 캐싱되며, 플레이리스트 쓰기 시 무효화됩니다.
         """
+        cache_key = get_list_cache_key(request.user.user_id, 'all', request.query_params)
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+
         # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
         queryset = Playlists.objects.all()
         # 공개 범위 필터링
@@ -59,11 +98,18 @@ class PlaylistListCreateView(APIView):
                 Q(user=request.user) | Q(visibility='public')
             )
         
-        # 최신순 정렬
-        queryset = queryset.order_by('-created_at')
+        # 최신순 정렬 + 생성자/개수 정보 일괄 조회 (N+1 방지)
+        queryset = PlaylistSerializer.setup_eager_loading(
+            queryset.order_by('-created_at', '-playlist_id'), request.user
+        )
         
-        serializer = PlaylistSerializer(queryset, many=True, context={'request': request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 페이지네이션
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = PlaylistSerializer(page, many=True, context={'request': request})
+        response = paginator.get_paginated_response(serializer.data)
+        cache.set(cache_key, response.data, get_cache_ttl(PLAYLIST_LIST_CACHE_TTL))
+        return response
     
     def post(self, request):
         """
@@ -81,6 +127,7 @@ class PlaylistListCreateView(APIView):
         if serializer.is_valid():
             # TrackableMixin이 자동으로 is_deleted=False, created_at, updated_at 설정
             playlist = serializer.save(user=request.user)
+            invalidate_user_playlist_lists(request.user.user_id)
             
             # 생성된 플레이리스트 상세 정보 반환
             detail_serializer = PlaylistDetailSerializer(playlist, context={'request': request})
@@ -96,6 +143,7 @@ class PlaylistLikedView(APIView):
     - GET: 좋아요한 플레이리스트 목록 조회
     """
     permission_classes = [AllowAny]  # IsAuthenticated에서 AllowAny로 변경 (앨범 API와 일관성)
+    pagination_class = PlaylistPagination
 
     def get(self, request):
         """
@@ -109,24 +157,34 @@ class PlaylistLikedView(APIView):
             if not request.user or not request.user.is_authenticated:
                 # 테스트용: userId 1 사용
                 user = get_object_or_404(Users, user_id=1)
+                # is_liked는 요청자(익명) 기준이라 userId 1의 캐시와 섞이지 않도록 캐싱하지 않음
+                cache_key = None
             else:
                 user = request.user
+                cache_key = get_list_cache_key(user.user_id, 'liked', request.query_params)
+                cached_data = cache.get(cache_key)
+                if cached_data is not None:
+                    return Response(cached_data)
             
-            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-            liked_playlist_ids = PlaylistLikes.objects.filter(
-                user=user
-            ).values_list('playlist_id', flat=True)
-
-            # 좋아요한 플레이리스트들 조회 (SoftDeleteManager 자동 적용)
+            # 좋아요한 플레이리스트들 조회 (playlist_likes JOIN 한 번으로 처리)
+            # 역참조 JOIN에는 SoftDeleteManager가 적용되지 않으므로 좋아요 삭제 여부를 직접 필터링
             # 시스템 플레이리스트 제외
             queryset = Playlists.objects.filter(
-                playlist_id__in=liked_playlist_ids
+                playlistlikes__user=user,
+                playlistlikes__is_deleted=False,
             ).exclude(
                 visibility='system'
-            ).order_by('-created_at')
+            ).order_by('-created_at', '-playlist_id').distinct()
+            queryset = PlaylistSerializer.setup_eager_loading(queryset, request.user)
 
-            serializer = PlaylistSerializer(queryset, many=True, context={'request': request})
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # 페이지네이션
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(queryset, request)
+            serializer = PlaylistSerializer(page, many=True, context={'request': request})
+            response = paginator.get_paginated_response(serializer.data)
+            if cache_key is not None:
+                cache.set(cache_key, response.data, get_cache_ttl(PLAYLIST_LIST_CACHE_TTL))
+            return response
             
         except Exception as e:
             # 에러 로깅
@@ -158,15 +216,12 @@ class PlaylistDetailView(APIView):
         플레이리스트 상세 조회
         GET /api/v1/playlists/{playlistId}
         """
+        # 자신의 플레이리스트이거나 공개/시스템 플레이리스트만 조회 (타인의 비공개 플레이리스트는 404)
         # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
-        
-        # 권한 확인: 자신의 플레이리스트이거나 공개 플레이리스트만 조회 가능
-        if playlist.visibility == 'private' and playlist.user != request.user:
-            return Response(
-                {'error': '비공개 플레이리스트는 조회할 수 없습니다.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        playlist = get_object_or_404(
+            Playlists.objects.filter(Q(user=request.user) | Q(visibility__in=['public', 'system'])),
+            playlist_id=playlist_id
+        )
         
         serializer = PlaylistDetailSerializer(playlist, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -182,8 +237,8 @@ class PlaylistDetailView(APIView):
             "visibility": "public" or "private" (선택)
         }
         """
-        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
+        # 권한 확인: 자신의 플레이리스트만 수정 가능 (타인의 플레이리스트는 404)
+        playlist = _get_owned_playlist(request, playlist_id)
         
         # 시스템 플레이리스트는 수정 불가
         if playlist.visibility == 'system':
@@ -192,17 +247,11 @@ class PlaylistDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # 권한 확인: 자신의 플레이리스트만 수정 가능
-        if playlist.user != request.user:
-            return Response(
-                {'error': '자신의 플레이리스트만 수정할 수 있습니다.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         serializer = PlaylistUpdateSerializer(playlist, data=request.data, partial=True)
         
         if serializer.is_valid():
             serializer.save()
+            invalidate_user_playlist_lists(playlist.user_id)
             
             # 수정된 플레이리스트 상세 정보 반환
             detail_serializer = PlaylistDetailSerializer(playlist, context={'request': request})
@@ -215,8 +264,8 @@ class PlaylistDetailView(APIView):
         플레이리스트 삭제
         DELETE /api/v1/playlists/{playlistId}
         """
-        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
+        # 권한 확인: 자신의 플레이리스트만 삭제 가능 (타인의 플레이리스트는 404)
+        playlist = _get_owned_playlist(request, playlist_id, only=PLAYLIST_PERMISSION_FIELDS)
         
         # 시스템 플레이리스트는 삭제 불가
         if playlist.visibility == 'system':
@@ -225,15 +274,9 @@ class PlaylistDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # 권한 확인: 자신의 플레이리스트만 삭제 가능
-        if playlist.user != request.user:
-            return Response(
-                {'error': '자신의 플레이리스트만 삭제할 수 있습니다.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         # TrackableMixin의 delete() 메서드가 자동으로 Soft Delete 수행
         playlist.delete()
+        invalidate_user_playlist_lists(playlist.user_id)
         
         return Response(
             {
@@ -263,59 +306,67 @@ class PlaylistItemAddView(APIView):
             "order": 1 (선택, 미지정 시 자동으로 마지막 순서)
         }
         """
-        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
-        
-        # 권한 확인: 자신의 플레이리스트에만 곡 추가 가능
-        if playlist.user != request.user:
-            return Response(
-                {'error': '자신의 플레이리스트에만 곡을 추가할 수 있습니다.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        # 권한 확인: 자신의 플레이리스트에만 곡 추가 가능 (타인의 플레이리스트는 404)
+        playlist = _get_owned_playlist(request, playlist_id, only=PLAYLIST_PERMISSION_FIELDS)
         
         serializer = PlaylistItemAddSerializer(data=request.data)
         
         if serializer.is_valid():
             music_id = serializer.validated_data['music_id']
             # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-            music = get_object_or_404(Music, music_id=music_id)
-            
-            # 이미 추가된 곡인지 확인
-            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-            existing_item = PlaylistItems.objects.filter(
-                playlist=playlist,
-                music=music
-            ).first()
+            # 응답의 artist_name/album_name을 위해 함께 JOIN
+            music = get_object_or_404(
+                Music.objects.select_related('artist', 'album'),
+                music_id=music_id
+            )
             
-            if existing_item:
+            order = serializer.validated_data.get('order')
+
+            try:
+                with transaction.atomic():
+                    # order 미지정 시 마지막 순서로 추가 (next_order 카운터 사용)
+                    order = playlist.allocate_item_order(order)
+
+                    # 곡 추가 (TrackableMixin이 자동으로 필드 설정)
+                    # 중복 여부는 (playlist_id, music_id) 부분 유니크 인덱스로 DB에서 판단
+                    item = PlaylistItems.objects.create(
+                        playlist=playlist,
+                        music=music,
+                        order=order
+                    )
+            except IntegrityError as e:
+                # 곡/플레이리스트가 동시에 삭제된 FK 위반 등은 중복이 아니므로 그대로 전파
+                if not is_constraint_violation(e, PLAYLIST_ITEM_UNIQUE_CONSTRAINT):
+                    raise
+                # 이미 추가된 곡 (카운터 증가도 함께 롤백됨)
                 return Response(
                     {'error': '이미 플레이리스트에 추가된 곡입니다.'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+            invalidate_user_playlist_lists(playlist.user_id)
             
-            # order 값 설정
-            order = serializer.validated_data.get('order')
-            if order is None:
-                # order 미지정 시 마지막 순서로 추가
-                # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-                last_item = PlaylistItems.objects.filter(
-                    playlist=playlist
-                ).order_by('-order').first()
-                
-                order = (last_item.order + 1) if last_item else 1
-            
-            # 곡 추가 (TrackableMixin이 자동으로 필드 설정)
-            item = PlaylistItems.objects.create(
-                playlist=playlist,
-                music=music,
-                order=order
-            )
-            
-            item_serializer = PlaylistItemSerializer(item)
+            # 응답 dict를 직접 구성 (출력 형식은 PlaylistItemSerializer와 동일)
             return Response(
                 {
                     'message': '플레이리스트에 곡이 추가되었습니다.',
-                    'item': item_serializer.data
+                    'item': {
+                        'item_id': item.item_id,
+                        'music': {
+                            'music_id': music.music_id,
+                            'music_name': music.music_name,
+                            'artist_name': music.artist.artist_name if music.artist else None,
+                            'album_name': music.album.album_name if music.album else None,
+                            'album_image': music.album.album_image if music.album else None,
+                            'audio_url': music.audio_url,
+                            'duration': music.duration,
+                            'genre': music.genre,
+                            'is_ai': music.is_ai,
+                            'lyrics': music.lyrics,
+                            'itunes_id': music.itunes_id,
+                        },
+                        'order': item.order,
+                        'created_at': _datetime_field.to_representation(item.created_at),
+                    }
                 },
                 status=status.HTTP_201_CREATED
             )
@@ -337,18 +388,13 @@ class PlaylistItemDeleteView(APIView):
         플레이리스트에서 곡 삭제
         DELETE /api/v1/playlists/items/{itemsId}
         """
+        # 권한 확인: 자신의 플레이리스트에서만 곡 삭제 가능 (타인의 플레이리스트 곡은 404)
         # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-        item = get_object_or_404(PlaylistItems, item_id=item_id)
-        
-        # 권한 확인: 자신의 플레이리스트에서만 곡 삭제 가능
-        if item.playlist.user != request.user:
-            return Response(
-                {'error': '자신의 플레이리스트에서만 곡을 삭제할 수 있습니다.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        item = get_object_or_404(PlaylistItems, item_id=item_id, playlist__user=request.user)
         
         # TrackableMixin의 delete() 메서드가 자동으로 Soft Delete 수행
         item.delete()
+        invalidate_user_playlist_lists(request.user.user_id)
         
         return Response(
             {'message': '플레이리스트에서 곡이 삭제되었습니다.'},
@@ -372,7 +418,10 @@ class PlaylistLikeView(APIView):
         POST /api/v1/playlists/{playlistId}/likes
         """
         # 플레이리스트 존재 확인 (SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회)
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
+        playlist = get_object_or_404(
+            Playlists.objects.only(*PLAYLIST_PERMISSION_FIELDS),
+            playlist_id=playlist_id
+        )
         
         # 시스템 플레이리스트에는 좋아요 불가
         if playlist.visibility == 'system':
@@ -382,25 +431,29 @@ class PlaylistLikeView(APIView):
             )
         
         # 자신의 플레이리스트에는 좋아요 불가
-        if playlist.user == request.user:
+        if playlist.user_id == request.user.user_id:
             return Response(
                 {'error': '자신의 플레이리스트에는 좋아요를 할 수 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # 공개 플레이리스트만 좋아요 가능 (선택적, 요구사항에 따라 변경 가능)
-        if playlist.visibility == 'private' and playlist.user != request.user:
+        if playlist.visibility == 'private' and playlist.user_id != request.user.user_id:
             return Response(
                 {'error': '비공개 플레이리스트에는 좋아요를 할 수 없습니다.'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # 이미 좋아요가 있는지 확인 (삭제된 것도 포함)
-        like = PlaylistLikes.all_objects.filter(user=request.user, playlist=playlist).first()
+        # 좋아요 조회 또는 생성 (삭제된 것도 포함, (user, playlist) 유니크 인덱스로 원자적 처리)
+        like, created = PlaylistLikes.all_objects.get_or_create(
+            user=request.user,
+            playlist=playlist,
+            defaults={'is_deleted': False},
+        )
         
-        if like:
+        if not created:
             if like.is_deleted:
-                # 삭제된 좋아요를 복구
+                # 삭제된 좋아요를 복구 (is_deleted, updated_at만 UPDATE)
                 like.restore()
             else:
                 # 이미 활성화된 좋아요가 있음
@@ -415,21 +468,22 @@ class PlaylistLikeView(APIView):
                     },
                     status=status.HTTP_200_OK
                 )
-        else:
-            # 새로운 좋아요 생성
-            like = PlaylistLikes.objects.create(user=request.user, playlist=playlist)
+
+        # 좋아요한 사용자의 좋아요 목록, 소유자 목록의 좋아요 개수가 바뀌므로 둘 다 무효화
+        invalidate_user_playlist_lists(request.user.user_id, playlist.user_id)
 
         # 좋아요 개수 조회
         like_count = PlaylistLikes.objects.filter(playlist=playlist).count()
 
-        serializer = PlaylistLikeSerializer({
-            'message': '좋아요가 등록되었습니다.',
-            'playlist_id': playlist_id,
-            'is_liked': True,
-            'like_count': like_count
-        })
-
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            {
+                'message': '좋아요가 등록되었습니다.',
+                'playlist_id': playlist_id,
+                'is_liked': True,
+                'like_count': like_count
+            },
+            status=status.HTTP_201_CREATED
+        )
     
     def delete(self, request, playlist_id):
         """
@@ -437,25 +491,30 @@ class PlaylistLikeView(APIView):
         DELETE /api/v1/playlists/{playlistId}/likes
         """
         # 플레이리스트 존재 확인 (SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회)
-        playlist = get_object_or_404(Playlists, playlist_id=playlist_id)
+        playlist = get_object_or_404(
+            Playlists.objects.only(*PLAYLIST_PERMISSION_FIELDS),
+            playlist_id=playlist_id
+        )
         
         # 좋아요 찾기 (SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회)
         try:
             like = PlaylistLikes.objects.get(user=request.user, playlist=playlist)
             # TrackableMixin의 delete() 메서드가 자동으로 Soft Delete 수행
             like.delete()
+            invalidate_user_playlist_lists(request.user.user_id, playlist.user_id)
 
             # 좋아요 개수 조회
             like_count = PlaylistLikes.objects.filter(playlist=playlist).count()
 
-            serializer = PlaylistLikeSerializer({
-                'message': '좋아요가 취소되었습니다.',
-                'playlist_id': playlist_id,
-                'is_liked': False,
-                'like_count': like_count
-            })
-
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                {
+                    'message': '좋아요가 취소되었습니다.',
+                    'playlist_id': playlist_id,
+                    'is_liked': False,
+                    'like_count': like_count
+                },
+                status=status.HTTP_200_OK
+            )
             
         except PlaylistLikes.DoesNotExist:
             # 좋아요 개수 조회
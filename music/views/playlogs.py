@@ -6,11 +6,47 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.utils import timezone
-from django.shortcuts import get_object_or_404
+from django.db import IntegrityError, transaction
+from django.http import Http404
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample
 
-from ..models import Music, PlayLogs, Users
+from ..models import Music, PlayLogs
 from ..serializers import PlayLogResponseSerializer, PlayLogListItemSerializer
+from ..services.internal import play_log_buffer
+from ..utils.statistics_cache import invalidate_user_statistics
+from .common import PlayLogPagination
+from .music import MusicPlayView
+
+
+# OpenAPI 문서용 설명 (모듈 로드 시 한 번만 생성)
+PLAY_LOG_CREATE_DESCRIPTION = """
+        음악 재생 시 재생 기록을 저장합니다.
+        
+        **요구사항:**
+        - 로그인 필수 (JWT 토큰)
+        - 같은 곡을 여러 번 재생해도 모두 기록됨
+        - 차트 집계의 원본 데이터로 사용됨
+        
+        **저장 방식:**
+        - REDIS_URL 설정 시: Redis 버퍼에 적재 후 202 반환 (play_log_id는 null, 수 초 내 DB 반영)
+        - 미설정 또는 Redis 장애 시: 즉시 DB 저장 후 201 반환
+        
+        **참고:**
+        - 음악 재생 정보 조회는 GET /tracks/{music_id}/play 사용
+        """
+
+MUSIC_PLAY_LOGS_DESCRIPTION = """
+        특정 음악의 재생 로그 목록을 조회합니다.
+        
+        **반환 정보:**
+        - user_id: 재생한 사용자 ID
+        - played_at: 재생 시간 (소수점 제거)
+        
+        **참고:**
+        - 삭제되지 않은 재생 로그만 조회됨
+        - 최신 재생 순으로 정렬
+        - 페이지네이션 적용 (page, page_size / 기본 100개, 최대 1000개)
+        """
 
 
 class PlayLogCreateView(APIView):
@@ -24,17 +60,7 @@ class PlayLogCreateView(APIView):
     
     @extend_schema(
         summary="재생 기록 생성",
-        description="""
-        음악 재생 시 재생 기록을 저장합니다.
-        
-        **요구사항:**
-        - 로그인 필수 (JWT 토큰)
-        - 같은 곡을 여러 번 재생해도 모두 기록됨
-        - 차트 집계의 원본 데이터로 사용됨
-        
-        **참고:**
-        - 음악 재생 정보 조회는 GET /tracks/{music_id}/play 사용
-        """,
+        description=PLAY_LOG_CREATE_DESCRIPTION,
         request=None,
         responses={
             201: OpenApiResponse(
@@ -52,6 +78,10 @@ class PlayLogCreateView(APIView):
                     )
                 ]
             ),
+            202: OpenApiResponse(
+                response=PlayLogResponseSerializer,
+                description="재생 기록 접수 (버퍼 적재, 비동기 저장)"
+            ),
             401: OpenApiResponse(description="인증 실패"),
             404: OpenApiResponse(description="음악을 찾을 수 없음"),
         },
@@ -66,58 +96,73 @@ class PlayLogCreateView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        # 1. 음악 존재 확인 (SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회)
-        music = get_object_or_404(Music, music_id=music_id)
-        
-        # 2. 사용자 조회 (JWT에서 email 추출)
+        # 버퍼 적재 시에는 음악 존재 확인을 생략하고, flush 작업이 존재하지 않거나 삭제된 음악의 기록을 걸러냄
+        played_at = timezone.now()
+
+        # 1. 재생 기록 버퍼에 적재 (REDIS_URL 설정 시)
+        # Celery가 주기적으로 bulk_create 하므로 요청마다 INSERT하지 않음
+        if play_log_buffer.enqueue(request.user.user_id, music_id, played_at):
+            return Response(
+                {
+                    "message": "재생 기록이 접수되었습니다",
+                    "play_log_id": None,
+                    "music_id": music_id,
+                    "played_at": played_at
+                },
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        # 2. 버퍼를 사용할 수 없으면 동기 저장
+        # request.user는 CustomJWTAuthentication이 이미 조회한 Users 인스턴스이므로 재조회하지 않음
+        # TrackableMixin이 created_at, updated_at, is_deleted를 자동으로 관리
+        # 삭제된 음악은 FK 제약으로 걸러지지 않으므로 flush 작업과 같은 규칙으로 먼저 확인
         # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        if not Music.objects.filter(music_id=music_id).exists():
+            return Response(
+                {"detail": "음악을 찾을 수 없습니다"},
+                status=status.HTTP_404_NOT_FOUND
+            )
         try:
-            user = Users.objects.get(email=request.user.email)
-        except Users.DoesNotExist:
+            # FK 제약이 지연(DEFERRABLE) 검사되는 경우도 여기서 잡히도록 트랜잭션으로 감쌈
+            with transaction.atomic():
+                play_log = PlayLogs.objects.create(
+                    music_id=music_id,
+                    user=request.user,
+                    played_at=played_at
+                )
+        except IntegrityError:
+            # 확인 직후 음악이 삭제된 경우 (FK 위반)
             return Response(
-                {"detail": "사용자를 찾을 수 없습니다"},
+                {"detail": "음악을 찾을 수 없습니다"},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # 3. 재생 기록 생성
-        # TrackableMixin이 created_at, updated_at, is_deleted를 자동으로 관리
-        play_log = PlayLogs.objects.create(
-            music=music,
-            user=user,
-            played_at=timezone.now()
-        )
+        # 사용자 통계 캐시 무효화 (버퍼 적재 시에는 flush 작업에서 무효화)
+        invalidate_user_statistics(request.user.user_id)
         
-        # 4. 응답 반환
+        # 3. 응답 반환
         response_data = {
             "message": "재생 기록이 저장되었습니다",
             "play_log_id": play_log.play_log_id,
-            "music_id": music.music_id,
+            "music_id": music_id,
             "played_at": play_log.played_at
         }
         
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
-class PlayLogView(APIView):
+class PlayLogView(MusicPlayView, PlayLogCreateView):
     """
     음악 재생 및 로그 기록을 위한 복합 View
     
-    - GET: MusicPlayView로 위임 (Music 도메인 - 재생 정보 조회)
-    - POST: PlayLogCreateView로 위임 (PlayLog 도메인 - 로그 기록)
+    - GET: MusicPlayView.get (Music 도메인 - 재생 정보 조회)
+    - POST: PlayLogCreateView.post (PlayLog 도메인 - 로그 기록)
     
-    이 복합 View는 단일 URL 엔드포인트에서 도메인별로 분리된 View들을 조합하는 역할만 수행합니다.
+    단일 URL 엔드포인트에서 도메인별 View의 핸들러를 상속으로 조합합니다.
+    요청마다 View 인스턴스를 새로 만들어 위임하지 않으므로 DRF dispatch(인증/권한 확인 등)는 한 번만 수행됩니다.
     실제 비즈니스 로직은 각 도메인 View에 위치합니다.
     """
     permission_classes = [AllowAny]
-    
-    def get(self, request, music_id):
-        """음악 재생 정보 조회 - MusicPlayView로 위임"""
-        from .music import MusicPlayView
-        return MusicPlayView().get(request, music_id)
-    
-    def post(self, request, music_id):
-        """재생 기록 생성 - PlayLogCreateView로 위임"""
-        return PlayLogCreateView().post(request, music_id)
 
 
 class MusicPlayLogsView(APIView):
@@ -126,20 +171,11 @@ class MusicPlayLogsView(APIView):
     - GET: 특정 음악의 모든 재생 로그 조회 (user_id, played_at)
     """
     permission_classes = [AllowAny]
+    pagination_class = PlayLogPagination
     
     @extend_schema(
         summary="음악별 재생 로그 조회",
-        description="""
-        특정 음악의 재생 로그 목록을 조회합니다.
-        
-        **반환 정보:**
-        - user_id: 재생한 사용자 ID
-        - played_at: 재생 시간 (소수점 제거)
-        
-        **참고:**
-        - 삭제되지 않은 재생 로그만 조회됨
-        - 최신 재생 순으로 정렬
-        """,
+        description=MUSIC_PLAY_LOGS_DESCRIPTION,
         responses={
             200: OpenApiResponse(
                 response=PlayLogListItemSerializer(many=True),
@@ -147,16 +183,21 @@ class MusicPlayLogsView(APIView):
                 examples=[
                     OpenApiExample(
                         name="성공 응답",
-                        value=[
-                            {
-                                "user_id": 1,
-                                "played_at": "2026-01-23T15:30:00Z"
-                            },
-                            {
-                                "user_id": 2,
-                                "played_at": "2026-01-23T14:20:00Z"
-                            }
-                        ]
+                        value={
+                            "count": 2,
+                            "next": None,
+                            "previous": None,
+                            "results": [
+                                {
+                                    "user_id": 1,
+                                    "played_at": "2026-01-23T15:30:00Z"
+                                },
+                                {
+                                    "user_id": 2,
+                                    "played_at": "2026-01-23T14:20:00Z"
+                                }
+                            ]
+                        }
                     )
                 ]
             ),
@@ -166,14 +207,23 @@ class MusicPlayLogsView(APIView):
     )
     def get(self, request, music_id):
         """특정 음악의 재생 로그 목록 조회"""
-        # 1. 음악 존재 확인
-        music = get_object_or_404(Music, music_id=music_id)
+        # 1. 음악 존재 확인 (행 전체 대신 존재 여부만 조회)
+        if not Music.objects.filter(music_id=music_id).exists():
+            raise Http404
         
         # 2. 해당 음악의 재생 로그 조회 (최신순)
-        play_logs = PlayLogs.objects.filter(music=music).order_by('-played_at')
+        # 필요한 두 컬럼만 dict로 조회 (모델 인스턴스 생성 + Serializer 순회 생략)
+        play_logs = PlayLogs.objects.filter(music_id=music_id).order_by(
+            '-played_at', '-play_log_id'
+        ).values('user_id', 'played_at')
         
-        # 3. Serializer로 변환
-        serializer = PlayLogListItemSerializer(play_logs, many=True)
+        # 3. 페이지네이션 후 played_at 소수점(마이크로초) 제거
+        # 출력 형식은 PlayLogListItemSerializer와 동일
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(play_logs, request)
+        for row in page:
+            if row['played_at']:
+                row['played_at'] = row['played_at'].replace(microsecond=0)
         
         # 4. 응답 반환
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(page)
@@ -1,18 +1,119 @@
 """
 음악 추천 관련 Views
 """
+import heapq
 import random
 import math
 from collections import defaultdict
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count
+from django.core.cache import cache
+from django.db.models import BooleanField, CharField, FloatField, IntegerField, Prefetch, Value
+from django.db.models.functions import Cast
+from django.db.models.expressions import RawSQL
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from ..models import Music, MusicTags
-from ..serializers.music import MusicDetailSerializer
+from ..models import AiInfo, Music, MusicTags
+from ..renderers import ORJSONRenderer
+from ..serializers.base import AlbumSerializer, ArtistSerializer
+from ..utils.music_tag_cache import get_tags_for
+
+# 후보 곡 점수 계산에 필요한 컬럼
+SCORING_FIELDS = ('music_id', 'genre', 'valence', 'arousal')
+
+# 같은 장르 곡 ID를 표본 추출할 때 DB에서 한 번에 읽는 행 수
+GENRE_SAMPLE_CHUNK_SIZE = 2000
+
+# 추천 응답 캐시 유지 시간 (초)
+RECOMMENDATION_CACHE_TTL = 60 * 5
+
+
+# music_to_dict에서 MusicDetailSerializer와 같은 형식으로 값을 변환하기 위한 필드/Serializer
+_emotion_field = serializers.DecimalField(max_digits=10, decimal_places=6)
+_datetime_field = serializers.DateTimeField()
+_artist_serializer = ArtistSerializer()
+_album_serializer = AlbumSerializer()
+
+
+def _datetime_to_representation(value):
+    return _datetime_field.to_representation(value) if value is not None else None
+
+
+def music_to_dict(music, tags, ai_info):
+    """
+    MusicDetailSerializer(music).data와 같은 형식의 dict 생성
+
+    추천 응답은 읽기 전용이므로 Serializer 필드 바인딩 없이 속성에서 바로 구성합니다.
+    (artist/album은 select_related로 함께 조회된 상태여야 함)
+
+    Args:
+        music: Music 인스턴스
+        tags: 음악의 Tags 목록
+        ai_info: AiInfo 인스턴스 (AI 곡이 아니거나 없으면 None)
+    """
+    artist = music.artist
+    album = music.album
+    return {
+        'music_id': music.music_id,
+        'music_name': music.music_name,
+        'artist': {
+            'artist_id': artist.artist_id,
+            'artist_name': artist.artist_name,
+            'artist_image': _artist_serializer.get_artist_image(artist),
+        } if artist else None,
+        'album': {
+            'album_id': album.album_id,
+            'album_name': album.album_name,
+            'album_image': _album_serializer.get_album_image(album),
+        } if album else None,
+        'genre': music.genre,
+        'duration': music.duration,
+        'is_ai': music.is_ai,
+        'audio_url': music.audio_url,
+        'lyrics': music.lyrics,
+        'valence': _emotion_field.to_representation(music.valence) if music.valence is not None else None,
+        'arousal': _emotion_field.to_representation(music.arousal) if music.arousal is not None else None,
+        'itunes_id': music.itunes_id,
+        'tags': [{'tag_id': tag.tag_id, 'tag_key': tag.tag_key} for tag in tags],
+        'ai_info': {
+            'aiinfo_id': ai_info.aiinfo_id,
+            'input_prompt': ai_info.input_prompt,
+            'created_at': _datetime_to_representation(ai_info.created_at),
+        } if ai_info else None,
+        'created_at': _datetime_to_representation(music.created_at),
+        'updated_at': _datetime_to_representation(music.updated_at),
+    }
+
+
+def _reservoir_sample(items, k):
+    """
+    이터러블에서 k개를 균등 확률로 무작위 선택 (저수지 표본 추출)
+
+    전체를 리스트로 만들지 않고 한 번 순회하며 k개만 유지합니다.
+    반환 순서도 무작위가 되도록 마지막에 섞습니다. (random.sample과 같은 결과 분포)
+    """
+    if k <= 0:
+        return []
+    reservoir = []
+    for index, item in enumerate(items):
+        if index < k:
+            reservoir.append(item)
+        else:
+            slot = random.randint(0, index)
+            if slot < k:
+                reservoir[slot] = item
+    random.shuffle(reservoir)
+    return reservoir
+
+
+def _recommendation_cache_key(base_music, limit):
+    """
+    추천 응답 캐시 키 (기준 곡 수정 시각 포함 → 곡 정보가 바뀌면 자동으로 새 키 사용)
+    """
+    updated_at = int(base_music.updated_at.timestamp()) if base_music.updated_at else 0
+    return f'rec:combined:{base_music.music_id}:{limit}:{updated_at}'
 
 
 class MusicRecommendationView(APIView):
@@ -22,6 +123,7 @@ class MusicRecommendationView(APIView):
     GET /api/v1/recommendations/?music_id={music_id}&limit=10
     태그, 장르, 감정 3가지 요소를 모두 고려하여 추천합니다.
     """
+    renderer_classes = [ORJSONRenderer]  # 곡 상세 정보가 포함된 결과 목록을 orjson으로 직렬화
     
     @extend_schema(
         summary="음악 추천",
@@ -68,15 +170,32 @@ class MusicRecommendationView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # 같은 곡/개수 요청은 TTL 동안 캐시된 응답 재사용 (동점 곡의 랜덤 순서도 함께 고정됨)
+        cache_key = _recommendation_cache_key(base_music, limit)
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+        
         # 3가지 요소를 모두 고려한 통합 추천
         recommended_with_scores = self._recommend_combined(base_music, limit)
         
+        # 추천 곡들의 AI 정보를 한 번에 조회 (태그는 _recommend_combined에서 prefetch됨)
+        musics = [item['music'] for item in recommended_with_scores]
+        ai_info_by_music = {}
+        ai_music_ids = [music.music_id for music in musics if music.is_ai]
+        if ai_music_ids:
+            for ai_info in AiInfo.objects.filter(music_id__in=ai_music_ids):
+                ai_info_by_music.setdefault(ai_info.music_id, ai_info)
+        
         # 점수 정보와 함께 응답 구성
         results = []
         for item in recommended_with_scores:
             music = item['music']
-            serializer = MusicDetailSerializer(music)
-            music_data = serializer.data
+            music_data = music_to_dict(
+                music,
+                [music_tag.tag for music_tag in music.live_music_tags if not music_tag.tag.is_deleted],
+                ai_info_by_music.get(music.music_id)
+            )
             music_data['scores'] = {
                 'tag_score': round(item['tag_score'], 2),
                 'genre_score': round(item['genre_score'], 2),
@@ -85,40 +204,31 @@ class MusicRecommendationView(APIView):
             }
             results.append(music_data)
         
-        return Response({
+        response_data = {
             'base_music_id': music_id,
             'count': len(results),
             'results': results
-        })
+        }
+        cache.set(cache_key, response_data, RECOMMENDATION_CACHE_TTL)
+        return Response(response_data)
     
     def _recommend_combined(self, base_music, limit):
         """태그, 장르, 감정 3가지 요소를 모두 고려한 통합 추천"""
         # 후보 곡들을 가져오기 (충분히 많이)
         candidate_limit = limit * 5
         
-        # 1. 태그 기반 후보 가져오기
-        tag_candidates = self._get_tag_candidates(base_music, candidate_limit)
-        
-        # 2. 장르 기반 후보 가져오기
-        genre_candidates = self._get_genre_candidates(base_music, candidate_limit)
-        
-        # 3. 감정 기반 후보 가져오기
-        emotion_candidates = self._get_emotion_candidates(base_music, candidate_limit)
+        # 기준 곡의 태그는 한 번만 조회하여 후보 조회와 점수 계산에 함께 사용 (frozenset)
+        base_tags = get_tags_for([base_music.music_id])[base_music.music_id]
         
-        # 모든 후보를 합치기 (music_id 기준으로 중복 제거)
-        all_candidates = {}
-        for music in tag_candidates + genre_candidates + emotion_candidates:
-            if music.music_id not in all_candidates:
-                all_candidates[music.music_id] = music
+        # 태그/장르/감정 후보를 한 번에 가져오기 (music_id 기준으로 중복 제거됨)
+        all_candidates = self._get_combined_candidates(base_music, base_tags, candidate_limit)
         
         if not all_candidates:
             return []
         
         # 각 곡에 대해 점수 계산
-        base_tags = set(MusicTags.objects.filter(
-            music=base_music,
-            is_deleted=False
-        ).values_list('tag__tag_id', flat=True))
+        # 후보 곡들의 태그를 캐시에서 한 번에 조회 (캐시에 없는 곡만 DB 일괄 조회)
+        tags_by_music = get_tags_for(all_candidates) if base_tags else {}
         
         base_valence = float(base_music.valence) if base_music.valence is not None else None
         base_arousal = float(base_music.arousal) if base_music.arousal is not None else None
@@ -131,11 +241,7 @@ class MusicRecommendationView(APIView):
             
             # 태그 점수 계산 (공통 태그 개수, 최대 30점)
             if base_tags:
-                music_tags = set(MusicTags.objects.filter(
-                    music=music,
-                    is_deleted=False
-                ).values_list('tag__tag_id', flat=True))
-                common_tags = base_tags & music_tags
+                common_tags = base_tags & tags_by_music[music_id]
                 # 태그당 점수를 낮추고 최대 30점으로 제한
                 tag_score = min(len(common_tags) * 5.0, 30.0)  # 태그당 5점, 최대 30점
             
@@ -146,10 +252,13 @@ class MusicRecommendationView(APIView):
             # 감정 점수 계산 (거리가 가까울수록 높은 점수)
             if base_valence is not None and base_arousal is not None:
                 if music.valence is not None and music.arousal is not None:
-                    distance = math.sqrt(
-                        (float(music.valence) - base_valence) ** 2 +
-                        (float(music.arousal) - base_arousal) ** 2
-                    )
+                    # 감정 후보는 DB에서 계산한 거리(distance)를 그대로 사용
+                    distance = getattr(music, 'distance', None)
+                    if distance is None:
+                        distance = math.hypot(
+                            float(music.valence) - base_valence,
+                            float(music.arousal) - base_arousal
+                        )
                     # 거리가 0이면 20점, 거리가 멀수록 점수 감소 (최대 거리 4.0 기준)
                     if distance < 4.0:
                         emotion_score = max(0, 20.0 * (1 - distance / 4.0))
@@ -164,14 +273,18 @@ class MusicRecommendationView(APIView):
                 'total_score': total_score
             })
         
-        # 점수 순으로 정렬 (내림차순)
-        scored_music.sort(key=lambda x: x['total_score'], reverse=True)
+        # 전체 정렬 대신 상위 limit번째 점수만 구해 그 이상인 곡만 남기기 (O(N log k))
+        # 경계 점수와 같은 곡은 모두 남겨 아래의 동점 랜덤 선택이 그대로 유지되도록 함
+        top_scores = heapq.nlargest(limit, (round(item['total_score'], 2) for item in scored_music))
+        cutoff = top_scores[-1] if top_scores else 0.0
         
         # 점수가 같은 경우 랜덤으로 섞기
         # 점수별로 그룹화
         score_groups = defaultdict(list)
         for item in scored_music:
-            score_groups[round(item['total_score'], 2)].append(item)
+            score = round(item['total_score'], 2)
+            if score >= cutoff:
+                score_groups[score].append(item)
         
         # 점수가 높은 순서대로, 같은 점수 내에서는 랜덤으로 선택
         final_recommended = []
@@ -182,210 +295,206 @@ class MusicRecommendationView(APIView):
             if len(final_recommended) >= limit:
                 break
         
-        return final_recommended[:limit]
+        final_recommended = final_recommended[:limit]
+        
+        # 선택된 곡만 전체 컬럼 + 아티스트/앨범 + 태그와 함께 다시 조회 (응답 직렬화용)
+        # 태그는 Prefetch 한 번으로 모든 곡 분량을 가져와 live_music_tags 속성에 담음
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        full_musics = Music.objects.filter(
+            music_id__in=[item['music'].music_id for item in final_recommended]
+        ).select_related('artist', 'album').prefetch_related(
+            Prefetch(
+                'musictags_set',
+                queryset=MusicTags.objects.select_related('tag'),
+                to_attr='live_music_tags'
+            )
+        ).in_bulk(field_name='music_id')
+        for item in final_recommended:
+            item['music'] = full_musics.get(item['music'].music_id)
+        
+        # 두 조회 사이에 삭제된 곡은 제외
+        return [item for item in final_recommended if item['music'] is not None]
     
-    def _get_tag_candidates(self, base_music, limit):
-        """태그 기반 후보 곡들 가져오기"""
-        base_tags = MusicTags.objects.filter(
-            music=base_music,
-            is_deleted=False
-        ).values_list('tag__tag_id', flat=True)
+    def _get_combined_candidates(self, base_music, base_tags, limit):
+        """
+        태그/장르/감정 기반 후보 곡들을 한 번에 가져오기
+        
+        세 후보 조회를 music_id만 고르는 UNION ALL 한 쿼리로 묶고, 선택된 곡을 한 번 더
+        조회하여 DB 왕복을 2회로 줄입니다. (감정 후보의 거리는 distance 속성으로 유지)
+        
+        Returns:
+            {music_id: Music} (태그, 장르, 감정 후보 순서)
+        """
+        # 타입 없는 NULL끼리 먼저 UNION되면 text로 결정되어 감정 후보의 double precision과 충돌하므로 명시적으로 캐스팅
+        no_distance = Cast(Value(None), FloatField())
+        parts = []
+        
+        # 1. 태그 기반 후보 (공통 태그 개수 순)
+        if base_tags:
+            parts.append(
+                self._similar_by_tags(base_music, base_tags).annotate(
+                    distance=no_distance,
+                    source=Value('tag', output_field=CharField())
+                ).values_list('music_id', 'distance', 'source')[:limit]
+            )
         
-        if not base_tags:
-            return []
+        # 2. 장르 기반 후보 (같은 장르 ID 전체를 가져와 Python에서 샘플링)
+        if base_music.genre:
+            parts.append(
+                Music.objects.filter(
+                    genre=base_music.genre,
+                    is_deleted=False
+                ).exclude(
+                    music_id=base_music.music_id
+                ).annotate(
+                    distance=no_distance,
+                    source=Value('genre', output_field=CharField())
+                ).values_list('music_id', 'distance', 'source')
+            )
         
-        similar_music_ids = MusicTags.objects.filter(
-            tag__tag_id__in=base_tags,
-            is_deleted=False
-        ).exclude(
-            music=base_music
-        ).values('music_id').annotate(
-            tag_count=Count('tag_id')
-        ).order_by('-tag_count')[:limit]
+        # 3. 감정 기반 후보 (GiST(point) 인덱스 KNN 탐색으로 가까운 순서대로)
+        if base_music.valence is not None and base_music.arousal is not None:
+            parts.append(
+                self._nearest_by_emotion(base_music).annotate(
+                    source=Value('emotion', output_field=CharField())
+                ).values_list('music_id', 'distance', 'source')[:limit]
+            )
         
-        music_ids = [item['music_id'] for item in similar_music_ids]
+        if not parts:
+            return {}
         
-        candidates = []
-        seen = set()
-        for music_id in music_ids:
-            if music_id not in seen:
-                try:
-                    music = Music.objects.select_related('artist', 'album').get(
-                        music_id=music_id,
-                        is_deleted=False
-                    )
-                    candidates.append(music)
-                    seen.add(music_id)
-                except Music.DoesNotExist:
+        ids_by_source = defaultdict(list)
+        distances = {}
+        
+        def genre_ids():
+            # 장르 후보는 목록으로 모으지 않고 바로 표본 추출에 넘기고, 나머지는 출처별로 모음
+            rows = parts[0].union(*parts[1:], all=True).iterator(chunk_size=GENRE_SAMPLE_CHUNK_SIZE)
+            for music_id, distance, source in rows:
+                if source == 'genre':
+                    yield music_id
                     continue
+                ids_by_source[source].append(music_id)
+                if distance is not None:
+                    distances[music_id] = distance
         
-        return candidates
-    
-    def _get_genre_candidates(self, base_music, limit):
-        """장르 기반 후보 곡들 가져오기"""
-        if not base_music.genre:
-            return []
+        sampled_genre_ids = _reservoir_sample(genre_ids(), limit)
         
-        candidates = list(Music.objects.filter(
-            genre=base_music.genre,
-            is_deleted=False
-        ).exclude(
-            music_id=base_music.music_id
-        ).select_related('artist', 'album').order_by('?')[:limit])
-        
-        return candidates
-    
-    def _get_emotion_candidates(self, base_music, limit):
-        """감정 기반 후보 곡들 가져오기"""
-        if base_music.valence is None or base_music.arousal is None:
-            return []
+        # 태그, 장르, 감정 순서로 중복 제거 (dict는 삽입 순서 유지)
+        candidate_ids = list(dict.fromkeys(
+            ids_by_source['tag'] + sampled_genre_ids + ids_by_source['emotion']
+        ))
+        # 점수 계산에 필요한 컬럼만 조회 (가사 등 큰 컬럼과 아티스트/앨범은 최종 곡만 다시 조회)
+        musics = Music.objects.filter(
+            music_id__in=candidate_ids
+        ).only(*SCORING_FIELDS).in_bulk(field_name='music_id')
         
-        base_valence = float(base_music.valence)
-        base_arousal = float(base_music.arousal)
-        
-        candidates = list(Music.objects.filter(
-            is_deleted=False,
-            valence__isnull=False,
-            arousal__isnull=False
-        ).exclude(
-            music_id=base_music.music_id
-        ).extra(
-            select={
-                'distance': f"""
-                    POWER(CAST(valence AS DECIMAL) - {base_valence}, 2) + 
-                    POWER(CAST(arousal AS DECIMAL) - {base_arousal}, 2)
-                """
-            },
-            where=[
-                f"""
-                POWER(CAST(valence AS DECIMAL) - {base_valence}, 2) + 
-                POWER(CAST(arousal AS DECIMAL) - {base_arousal}, 2) < 4.0
-                """
-            ],
-            order_by=['distance']
-        ).select_related('artist', 'album')[:limit])
-        
-        return candidates
+        all_candidates = {}
+        for music_id in candidate_ids:
+            music = musics.get(music_id)
+            if music is None:
+                continue
+            if music_id in distances:
+                music.distance = distances[music_id]
+            all_candidates[music_id] = music
+        return all_candidates
     
     def _recommend_by_tags(self, base_music, limit):
         """태그 기반 추천"""
-        # 현재 곡의 태그 가져오기
-        base_tags = MusicTags.objects.filter(
-            music=base_music,
-            is_deleted=False
-        ).select_related('tag').values_list('tag__tag_id', flat=True)
+        # 현재 곡의 태그 가져오기 (캐시 우선)
+        base_tags = get_tags_for([base_music.music_id])[base_music.music_id]
         
         if not base_tags:
             # 태그가 없으면 빈 리스트 반환
             return []
         
         # 같은 태그를 가진 다른 곡들 찾기 (태그 개수로 정렬)
-        similar_music_ids = MusicTags.objects.filter(
-            tag__tag_id__in=base_tags,
-            is_deleted=False
-        ).exclude(
-            music=base_music
-        ).values('music_id').annotate(
-            tag_count=Count('tag_id')
-        ).order_by('-tag_count')[:limit * 3]  # 더 많이 가져와서 랜덤 선택
+        similar_music = self._similar_by_tags(base_music, base_tags)[:limit * 3]  # 더 많이 가져와서 랜덤 선택
         
-        # 태그 개수별로 그룹화 (중복 제거)
+        # 태그 개수별로 그룹화 (music_id가 PK이므로 중복 없음)
         tag_count_groups = defaultdict(list)
-        seen_music_ids = set()
-        for item in similar_music_ids:
-            music_id = item['music_id']
-            if music_id not in seen_music_ids:
-                tag_count_groups[item['tag_count']].append(music_id)
-                seen_music_ids.add(music_id)
+        for music in similar_music:
+            tag_count_groups[music.tag_count].append(music)
         
         # 태그 개수가 많은 순서대로, 같은 개수 내에서는 랜덤으로 선택
-        music_ids = []
+        recommended = []
         for tag_count in sorted(tag_count_groups.keys(), reverse=True):
-            group_music_ids = tag_count_groups[tag_count]
-            random.shuffle(group_music_ids)  # 같은 태그 개수 내에서 랜덤
-            music_ids.extend(group_music_ids)
-            if len(music_ids) >= limit * 2:
+            group_music = tag_count_groups[tag_count]
+            random.shuffle(group_music)  # 같은 태그 개수 내에서 랜덤
+            recommended.extend(group_music)
+            if len(recommended) >= limit:
                 break
         
-        # 최종 추천 곡 조회 (중복 제거, 순서 유지)
-        seen = set()
-        recommended = []
-        for music_id in music_ids:
-            if music_id not in seen:
-                try:
-                    music = Music.objects.select_related('artist', 'album').get(
-                        music_id=music_id,
-                        is_deleted=False
-                    )
-                    recommended.append(music)
-                    seen.add(music_id)
-                    if len(recommended) >= limit:
-                        break
-                except Music.DoesNotExist:
-                    continue
-        
-        return recommended
+        return recommended[:limit]
+    
+    def _similar_by_tags(self, base_music, base_tags):
+        """
+        기준 곡과 태그가 하나 이상 겹치는 곡 QuerySet (공통 태그 개수 내림차순)
+        
+        music.tag_ids(migrations/0007, music_tags 트리거로 동기화되는 태그 ID 배열)의
+        && 연산자는 GIN 인덱스로 처리되므로, music_tags JOIN + GROUP BY 집계 없이
+        후보 곡을 Music에서 바로 조회합니다. tag_count 속성에 공통 태그 개수가 담깁니다.
+        (intarray의 & 연산자는 int4 배열 전용이라, 행마다 tag_ids를 펼쳐 = ANY로 개수를 셉니다.
+         tag_ids는 곡별 태그 ID가 중복 없이 들어 있으므로 INTERSECT 중복 제거가 필요 없음)
+        """
+        base_tag_list = sorted(base_tags)
+        shares_tag = RawSQL(
+            "music.tag_ids && %s::bigint[]",
+            (base_tag_list,),
+            output_field=BooleanField()
+        )
+        tag_count = RawSQL(
+            "(SELECT count(*) FROM unnest(music.tag_ids) AS t(tag_id) WHERE t.tag_id = ANY(%s::bigint[]))",
+            (base_tag_list,),
+            output_field=IntegerField()
+        )
+        return Music.objects.filter(
+            shares_tag,
+            is_deleted=False
+        ).exclude(
+            music_id=base_music.music_id
+        ).annotate(
+            tag_count=tag_count
+        ).order_by('-tag_count').select_related('artist', 'album')
     
     def _recommend_by_genre(self, base_music, limit):
         """장르 기반 추천"""
         if not base_music.genre:
             return []
         
-        # 같은 장르의 다른 곡들 찾기 (랜덤 정렬, 중복 방지)
-        # 더 많이 가져와서 중복 제거 후 limit만큼 반환
-        all_music = Music.objects.filter(
+        # 같은 장르의 다른 곡들 중 랜덤으로 선택 (music_id가 PK이므로 중복 없음)
+        return self._sample_same_genre(base_music, limit)
+    
+    def _sample_same_genre(self, base_music, limit):
+        """
+        같은 장르의 다른 곡을 랜덤으로 limit개 선택
+        
+        ORDER BY RANDOM()은 장르 전체 행을 정렬하므로, music_id만 청크 단위로 읽으면서
+        Python에서 저수지 표본 추출을 하고 선택된 곡만 다시 조회합니다.
+        """
+        music_ids = Music.objects.filter(
             genre=base_music.genre,
             is_deleted=False
         ).exclude(
             music_id=base_music.music_id
-        ).select_related('artist', 'album').order_by('?')
+        ).values_list('music_id', flat=True).iterator(chunk_size=GENRE_SAMPLE_CHUNK_SIZE)
         
-        # 중복 제거 (music_id 기준)
-        seen = set()
-        recommended = []
-        for music in all_music:
-            if music.music_id not in seen:
-                recommended.append(music)
-                seen.add(music.music_id)
-                if len(recommended) >= limit:
-                    break
+        sampled_ids = _reservoir_sample(music_ids, limit)
         
-        return recommended
+        musics = Music.objects.filter(
+            music_id__in=sampled_ids
+        ).select_related('artist', 'album').in_bulk(field_name='music_id')
+        
+        return [musics[music_id] for music_id in sampled_ids if music_id in musics]
     
     def _recommend_by_emotion(self, base_music, limit):
         """Arousal-Valence 기반 추천"""
         if base_music.valence is None or base_music.arousal is None:
             return []
         
-        # 유클리드 거리 계산을 위한 SQL 쿼리
-        # (valence - base_valence)^2 + (arousal - base_arousal)^2 가 작은 순서로 정렬
-        base_valence = float(base_music.valence)
-        base_arousal = float(base_music.arousal)
-        
         # 유사도 계산: 거리가 가까울수록 유사함
-        # 거리 범위를 설정하여 너무 먼 곡은 제외 (예: 거리 < 2.0)
+        # 거리 범위를 설정하여 너무 먼 곡은 제외 (거리 < 2.0)
         # 더 많이 가져와서 중복 제거 후 limit만큼 반환
-        all_music = Music.objects.filter(
-            is_deleted=False,
-            valence__isnull=False,
-            arousal__isnull=False
-        ).exclude(
-            music_id=base_music.music_id
-        ).extra(
-            select={
-                'distance': f"""
-                    POWER(CAST(valence AS DECIMAL) - {base_valence}, 2) + 
-                    POWER(CAST(arousal AS DECIMAL) - {base_arousal}, 2)
-                """
-            },
-            where=[
-                f"""
-                POWER(CAST(valence AS DECIMAL) - {base_valence}, 2) + 
-                POWER(CAST(arousal AS DECIMAL) - {base_arousal}, 2) < 4.0
-                """
-            ],
-            order_by=['distance']
-        ).select_related('artist', 'album')[:limit * 2]
+        all_music = self._nearest_by_emotion(base_music)[:limit * 2]
         
         # 중복 제거 (music_id 기준)
         seen = set()
@@ -398,3 +507,39 @@ class MusicRecommendationView(APIView):
                     break
         
         return recommended
+    
+    def _nearest_by_emotion(self, base_music):
+        """
+        Arousal-Valence 평면에서 기준 곡과 가까운 곡 QuerySet (거리 오름차순)
+        
+        (valence, arousal)을 point로 보고 PostgreSQL의 <-> 거리 연산자로 정렬합니다.
+        migrations/0006의 GiST 표현식 인덱스가 같은 식을 사용하므로
+        전체 행을 스캔/정렬하지 않고 인덱스 KNN 탐색으로 가까운 곡부터 읽습니다.
+        
+        거리 2.0 이내의 곡은 항상 한 변이 4.0인 정사각형 안에 있으므로, 같은 인덱스로
+        처리되는 박스 포함(<@) 조건을 먼저 걸어 반경 밖의 행은 아예 읽지 않습니다.
+        """
+        base_valence = float(base_music.valence)
+        base_arousal = float(base_music.arousal)
+        distance = RawSQL(
+            "point(valence::float8, arousal::float8) <-> point(%s, %s)",
+            (base_valence, base_arousal),
+            output_field=FloatField()
+        )
+        within_box = RawSQL(
+            "point(valence::float8, arousal::float8) <@ box(point(%s, %s), point(%s, %s))",
+            (base_valence - 2.0, base_arousal - 2.0, base_valence + 2.0, base_arousal + 2.0),
+            output_field=BooleanField()
+        )
+        return Music.objects.filter(
+            within_box,
+            is_deleted=False,
+            valence__isnull=False,
+            arousal__isnull=False
+        ).exclude(
+            music_id=base_music.music_id
+        ).annotate(
+            distance=distance
+        ).filter(
+            distance__lt=2.0  # 제곱 거리 < 4.0 과 동일
+        ).order_by('distance').select_related('artist', 'album')
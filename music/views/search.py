@@ -1,21 +1,116 @@
 """
 검색 관련 Views - iTunes 기반 음악 검색 및 AI 음악 검색
 """
+import functools
+import hashlib
 import re
 import random
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from celery import group
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import Q, Prefetch
+from django.db.models import Count, Exists, F, Max, OuterRef, Prefetch
+from django.db.models.functions import Lower
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 from ..models import Music, MusicTags, Tags, Artists, Albums, AiInfo
+from ..renderers import ORJSONRenderer
 from ..serializers import iTunesSearchResultSerializer, AiMusicSearchResultSerializer, TagMusicSearchSerializer
 from ..services import iTunesService
 from ..tasks import fetch_artist_image_task, fetch_album_image_task
-from .common import MusicPagination
+from .common import MusicPagination, TagSearchPagination
+
+# 검색어의 태그 패턴: '# ' (해시+공백) 뒤의 단어
+# '#'은 검색어 시작 또는 공백 뒤에 있을 때만 태그로 인식 ("C# 음악"의 '음악'은 태그가 아님)
+SEARCH_TAG_PATTERN = re.compile(r'(?<!\S)#\s+(\w+)')
+
+# 검색어 파싱 결과를 메모이즈할 최대 검색어 수
+SEARCH_QUERY_PARSE_CACHE_SIZE = 4096
+
+# iTunes 검색 결과 개수와 캐시 유지 시간 (초)
+ITUNES_SEARCH_LIMIT = 50
+ITUNES_SEARCH_CACHE_TTL = 60 * 60
+
+# 검색어 + 태그 검색 시 iTunes API 호출을 태그 DB 조회와 동시에 실행하기 위한 스레드 풀
+# (iTunes 호출은 DB를 사용하지 않으므로 별도 스레드에서 실행해도 DB 연결 문제가 없음)
+_itunes_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='itunes-search')
+
+# iTunes 파싱 결과(iTunesService.parse_track_data)에서 DB 연결에 쓰는 키를 한 번에 꺼내는 getter
+# (파싱 결과에는 항상 두 키가 있으므로 item.get 대신 사용)
+_itunes_link_keys = itemgetter('itunes_id', 'artist_name')
+
+# 태그만 검색할 때 응답 구성에 필요한 음악/아티스트/앨범 컬럼
+TAG_SEARCH_MUSIC_FIELDS = (
+    'music_id', 'itunes_id', 'music_name', 'genre', 'duration', 'audio_url',
+    'artist', 'artist__artist_id', 'artist__artist_name',
+    'album', 'album__album_id', 'album__album_name', 'album__album_image',
+)
+
+# AI 음악 검색(AiMusicSearchView) 응답 구성에 필요한 음악/아티스트/앨범 컬럼
+# (AiMusicSearchResultSerializer + ArtistSerializer/AlbumSerializer의 이미지 선택 필드)
+AI_MUSIC_SEARCH_FIELDS = (
+    'music_id', 'music_name', 'genre', 'duration', 'audio_url', 'is_ai', 'created_at',
+    'artist', 'artist__artist_id', 'artist__artist_name', 'artist__artist_image', 'artist__image_large_circle',
+    'album', 'album__album_id', 'album__album_name', 'album__album_image', 'album__image_square',
+)
+
+# 태그 검색(TagMusicSearchView) 최대 반환 곡 수
+TAG_SEARCH_MAX_RESULTS = 150
+
+
+def _itunes_search_cache_key(term, limit):
+    """
+    iTunes 검색 결과 캐시 키 (검색어의 공백/특수문자가 키에 들어가지 않도록 해시 사용)
+    
+    iTunes 검색은 대소문자와 연속 공백을 구분하지 않으므로,
+    정규화한 검색어로 키를 만들어 "IU", " iu ", "Iu" 같은 변형이 같은 캐시를 사용하게 합니다.
+    """
+    normalized_term = ' '.join(term.lower().split())
+    term_hash = hashlib.md5(normalized_term.encode('utf-8')).hexdigest()
+    return f'itunes:search:{term_hash}:{limit}'
+
+
+def _name_key(name):
+    """아티스트/앨범명 비교 키 (대소문자만 다른 이름을 같은 아티스트/앨범으로 처리, DB 조회의 Lower()와 같은 규칙)"""
+    return name.lower()
+
+
+@functools.lru_cache(maxsize=SEARCH_QUERY_PARSE_CACHE_SIZE)
+def _parse_search_query(query_string):
+    """
+    검색어를 (검색어, 태그 튜플)로 파싱 (MusicSearchView.parse_search_query 참고)
+    
+    같은 검색어가 반복되는 경우가 많아 결과를 메모이즈합니다.
+    캐시된 값이 공유되므로 변경할 수 없는 튜플로 반환합니다.
+    """
+    if not query_string:
+        return None, ()
+    
+    # '#'이 없으면 정규식 없이 전체가 검색어 (대부분의 검색)
+    if '#' not in query_string:
+        return query_string.strip() or None, ()
+    
+    # '# ' (해시+공백) 뒤의 단어들을 태그로 추출하면서,
+    # 태그 사이의 나머지 부분을 이어 붙여 검색어로 사용 (문자열을 한 번만 탐색)
+    tags = []
+    term_parts = []
+    last_end = 0
+    for match in SEARCH_TAG_PATTERN.finditer(query_string):
+        term_parts.append(query_string[last_end:match.start()])
+        tags.append(match.group(1))
+        last_end = match.end()
+    term_parts.append(query_string[last_end:])
+    
+    term = ''.join(term_parts).strip()
+    term = term if term else None
+    
+    return term, tuple(tags)
 
 
 class MusicSearchView(APIView):
@@ -30,6 +125,7 @@ class MusicSearchView(APIView):
     """
     permission_classes = [AllowAny]
     pagination_class = MusicPagination
+    renderer_classes = [ORJSONRenderer]  # 검색 결과 목록(최대 100곡)을 orjson으로 직렬화
     
     def parse_search_query(self, query_string):
         """
@@ -43,20 +139,11 @@ class MusicSearchView(APIView):
         - "아이유 # christmas" → {"term": "아이유", "tags": ["christmas"]}
         - "아이유 # christmas # 신나는" → {"term": "아이유", "tags": ["christmas", "신나는"]}
         - "C#" → {"term": "C#", "tags": []} (공백 없으면 일반 텍스트)
+        - "C# 음악" → {"term": "C# 음악", "tags": []} ('#' 앞이 공백이 아니면 일반 텍스트)
         - "I'm #1" → {"term": "I'm #1", "tags": []} (공백 없으면 일반 텍스트)
         """
-        if not query_string:
-            return {"term": None, "tags": []}
-        
-        # '# ' (해시+공백) 뒤의 단어들을 태그로 추출
-        tag_pattern = r'#\s+(\w+)'
-        tags = re.findall(tag_pattern, query_string)
-        
-        # 태그 패턴 제거한 나머지가 검색어
-        term = re.sub(tag_pattern, '', query_string).strip()
-        term = term if term else None
-        
-        return {"term": term, "tags": tags}
+        term, tags = _parse_search_query(query_string)
+        return {"term": term, "tags": list(tags)}
     
     @extend_schema(
         summary="iTunes 음악 검색",
@@ -107,6 +194,14 @@ class MusicSearchView(APIView):
                     ),
                 ]
             ),
+            OpenApiParameter(
+                name='enrich',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description='iTunes 결과에 DB 정보(music_id, artist_id, album_id) 연결 여부 (false면 iTunes 원본 데이터만 반환)',
+                required=False,
+                default=True
+            ),
             OpenApiParameter(
                 name='page',
                 type=OpenApiTypes.INT,
@@ -141,191 +236,276 @@ class MusicSearchView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 검색어 파싱
-        parsed = self.parse_search_query(query)
-        term = parsed['term']
-        tags = parsed['tags']
+        # 검색어 파싱 (같은 검색어는 메모이즈된 결과 재사용)
+        term, tags = _parse_search_query(query)
         
-        results = []
+        # enrich=false면 iTunes 결과에 DB 정보를 연결하지 않음 (미리보기 등 iTunes 원본만 필요한 경우)
+        enrich = request.query_params.get('enrich', 'true').lower() != 'false'
+        
+        paginator = self.pagination_class()
         
         # 1. 일반 검색어가 있으면 iTunes API 호출
         if term:
-            itunes_data = iTunesService.search(term, limit=50)
+            # 같은 검색어는 캐시된 파싱 결과 재사용 (iTunes API 호출 + 파싱 생략)
+            itunes_cache_key = _itunes_search_cache_key(term, ITUNES_SEARCH_LIMIT)
+            parsed_results = cache.get(itunes_cache_key)
             
-            if 'error' in itunes_data:
-                return Response(
-                    {'error': f'iTunes API 오류: {itunes_data["error"]}'},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE
-                )
+            itunes_future = None
+            if parsed_results is None:
+                if tags:
+                    # 태그 DB 조회를 기다리지 않도록 iTunes 호출을 먼저 백그라운드로 시작
+                    itunes_future = _itunes_executor.submit(
+                        iTunesService.search, term, limit=ITUNES_SEARCH_LIMIT
+                    )
+                else:
+                    itunes_data = iTunesService.search(term, limit=ITUNES_SEARCH_LIMIT)
             
-            # iTunes 결과 파싱
-            parsed_results = iTunesService.parse_search_results(itunes_data.get('results', []))
+            # 2. iTunes 호출 중이면 응답을 기다리는 동안 태그 매칭 itunes_id 조회
+            # (아직 iTunes 결과를 모르므로 태그를 가진 전체 곡 대상)
+            itunes_ids_with_tags = None
+            if itunes_future is not None:
+                itunes_ids_with_tags = self._find_itunes_ids_with_tags(tags)
+                itunes_data = itunes_future.result()
             
-            # DB에 이미 있는지 확인
-            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-            itunes_ids = [r['itunes_id'] for r in parsed_results if r.get('itunes_id')]
-            existing_music = Music.objects.filter(
-                itunes_id__in=itunes_ids
-            ).values_list('itunes_id', flat=True)
+            if parsed_results is None:
+                if 'error' in itunes_data:
+                    return Response(
+                        {'error': f'iTunes API 오류: {itunes_data["error"]}'},
+                        status=status.HTTP_503_SERVICE_UNAVAILABLE
+                    )
+                
+                # iTunes 결과 파싱 (오류 응답은 캐싱하지 않음)
+                parsed_results = iTunesService.parse_search_results(itunes_data.get('results', []))
+                cache.set(itunes_cache_key, parsed_results, ITUNES_SEARCH_CACHE_TTL)
             
-            existing_set = set(existing_music)
+            # 태그가 있으면 태그 매칭된 것만 남기면서 매칭 표시 (AND 로직, itunes_id만으로 판단 가능)
+            # 태그가 없으면 has_matching_tags는 시리얼라이저 기본값(False) 사용
+            if tags:
+                if itunes_ids_with_tags is None:
+                    # 캐시된 iTunes 결과가 있으면 그 곡들로 범위를 좁혀 조회 (태그 인기도와 무관하게 최대 ITUNES_SEARCH_LIMIT개)
+                    itunes_ids_with_tags = self._find_itunes_ids_with_tags(
+                        tags,
+                        itunes_ids={item['itunes_id'] for item in parsed_results if item.get('itunes_id')}
+                    )
+                parsed_results = [
+                    dict(item, has_matching_tags=True) for item in parsed_results
+                    if item.get('itunes_id') in itunes_ids_with_tags
+                ]
             
-            # 아티스트 이름으로 DB에서 아티스트 ID 조회 및 생성 (일괄 처리)
-            artist_names = list(set([r.get('artist_name') for r in parsed_results if r.get('artist_name')]))
-            artist_name_to_id = {}
-            if artist_names:
-                # DB에 있는 아티스트 조회
-                # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-                existing_artists = Artists.objects.filter(
-                    artist_name__in=artist_names
-                ).values('artist_id', 'artist_name')
-                artist_name_to_id = {a['artist_name']: a['artist_id'] for a in existing_artists}
-                
-                # DB에 없는 아티스트 생성
-                for artist_name in artist_names:
-                    if artist_name not in artist_name_to_id:
-                        # TrackableMixin이 자동으로 created_at, is_deleted 설정
-                        artist, artist_created = Artists.objects.get_or_create(
-                            artist_name=artist_name,
-                            defaults={
-                                'artist_image': '',  # 비동기로 수집
-                            }
-                        )
-                        artist_name_to_id[artist_name] = artist.artist_id
-                        
-                        # 아티스트 이미지 비동기 수집 (새로 생성되었거나 이미지가 없는 경우)
-                        if artist_created or not artist.artist_image:
-                            try:
-                                fetch_artist_image_task.delay(artist.artist_id, artist_name)
-                            except Exception as e:
-                                # 태스크 호출 실패해도 기본 저장은 완료되도록 함
-                                import logging
-                                logging.getLogger(__name__).warning(
-                                    f"아티스트 이미지 태스크 호출 실패: {e}"
-                                )
+            # 3. 페이지네이션 후 현재 페이지의 곡만 DB 정보 연결 (아티스트/앨범 조회 및 생성)
+            page = paginator.paginate_queryset(parsed_results, request)
+            if enrich:
+                self._link_itunes_results_to_db(page)
+            else:
+                for item in page:
+                    item.update(music_id=None, in_db=False, artist_id=None, album_id=None)
+        elif tags:
+            # 2. 태그만 검색 (#christmas)
+            # DB에서 해당 태그를 가진 음악 조회
+            # 태그 매칭 itunes_id는 서브쿼리로 넘겨 한 번의 쿼리로 처리 (ID 목록을 Python으로 가져오지 않음)
+            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+            # 응답에 쓰는 컬럼만 조회 (가사 등 큰 컬럼 제외)
+            # 최신 등록순 정렬: 기본 키 인덱스를 역순으로 읽어 정렬 없이 LIMIT/OFFSET 처리
+            musics = Music.objects.filter(
+                itunes_id__in=self._itunes_ids_with_tags_queryset(tags)
+            ).select_related('artist', 'album').only(*TAG_SEARCH_MUSIC_FIELDS).order_by('-music_id')
             
-            # 앨범 이름과 아티스트 조합으로 DB에서 앨범 ID 조회 및 생성
-            # 앨범은 아티스트별로 처리해야 하므로 결과별로 처리
-            album_key_to_id = {}  # (album_name, artist_id) -> album_id
+            # 3. QuerySet을 그대로 페이지네이션하여 DB에서 현재 페이지만 조회 (LIMIT/OFFSET)
+            # 현재 페이지의 Music 객체만 iTunes 검색 결과 형식으로 변환
+            page = [
+                self._music_to_search_result(music)
+                for music in paginator.paginate_queryset(musics, request)
+            ]
+        else:
+            page = paginator.paginate_queryset([], request)
+        
+        serializer = iTunesSearchResultSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+    
+    def _music_to_search_result(self, music):
+        """DB의 Music 객체를 iTunes 검색 결과 형식의 dict로 변환 (태그 검색 결과용)"""
+        return {
+            'music_id': music.music_id,
+            'itunes_id': music.itunes_id,
+            'music_name': music.music_name,
+            'artist_name': music.artist.artist_name if music.artist else '',
+            'artist_id': music.artist.artist_id if music.artist else None,
+            'album_name': music.album.album_name if music.album else '',
+            'album_id': music.album.album_id if music.album else None,
+            'genre': music.genre or '',
+            'duration': music.duration,
+            'audio_url': music.audio_url,
+            'album_image': music.album.album_image if music.album else '',
+            'in_db': True,
+            'has_matching_tags': True,
+        }
+    
+    def _find_itunes_ids_with_tags(self, tags, itunes_ids=None):
+        """
+        검색 태그를 모두 가진 곡의 itunes_id 집합 조회 (iTunes 검색 결과 필터용)
+        
+        itunes_ids를 넘기면 해당 곡들 중에서만 조회합니다.
+        """
+        itunes_ids_with_tags = self._itunes_ids_with_tags_queryset(tags)
+        if itunes_ids is not None:
+            itunes_ids_with_tags = itunes_ids_with_tags.filter(music__itunes_id__in=itunes_ids)
+        return set(itunes_ids_with_tags)
+    
+    def _itunes_ids_with_tags_queryset(self, tags):
+        """검색 태그를 모두 가진 곡의 itunes_id QuerySet (서브쿼리로도 사용)"""
+        # DB에서 모든 태그를 가진 곡의 itunes_id 찾기 (AND 조건)
+        # tags를 JOIN하여 태그 키로 필터링하고, 곡별로 일치한 태그 수가 검색 태그 수와 같은 곡만 선택
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        tag_keys = set(tags)
+        return MusicTags.objects.filter(
+            tag__tag_key__in=tag_keys,
+            tag__is_deleted=False,
+            music__itunes_id__isnull=False
+        ).values('music__itunes_id').annotate(
+            matched_tag_count=Count('tag__tag_key', distinct=True)
+        ).filter(
+            matched_tag_count=len(tag_keys)
+        ).values_list('music__itunes_id', flat=True)
+    
+    @transaction.atomic
+    def _link_itunes_results_to_db(self, items):
+        """
+        iTunes 검색 결과에 DB 정보 연결 (music_id, in_db, artist_id, album_id)
+        
+        DB에 없는 아티스트/앨범은 생성하고 이미지 수집 태스크를 호출합니다.
+        응답할 페이지의 결과만 넘겨 불필요한 조회/생성을 하지 않습니다.
+        아티스트/앨범 생성은 하나의 트랜잭션으로 커밋하고, 태스크는 커밋 후에 호출합니다.
+        """
+        # 음악/아티스트 조회용 IN 목록을 결과를 한 번만 순회하여 구성
+        # 같은 아티스트의 곡이 여러 개일 수 있으므로 set으로 중복 제거 (IN 목록 축소)
+        # 아티스트는 대소문자를 구분하지 않는 이름 키로 묶음 ("IU"와 "iu"를 같은 아티스트로 처리)
+        itunes_ids = set()
+        artist_names = {}  # 이름 키 -> iTunes 표기 이름 (새로 생성할 때 사용)
+        for item in items:
+            itunes_id, artist_name = _itunes_link_keys(item)
+            if itunes_id:
+                itunes_ids.add(itunes_id)
+            if artist_name:
+                artist_names.setdefault(_name_key(artist_name), artist_name)
+        
+        # DB에 이미 있는지 확인 (같은 쿼리로 music_id도 함께 조회)
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        existing_music_ids = dict(Music.objects.filter(
+            itunes_id__in=itunes_ids
+        ).values_list('itunes_id', 'music_id'))
+        
+        # 이미지 수집 태스크는 모아 두었다가 group으로 한 번에 호출 (건마다 브로커 왕복하지 않음)
+        image_tasks = []
+        
+        # 아티스트 이름으로 DB에서 아티스트 ID 조회 및 생성 (일괄 처리)
+        artist_key_to_id = {}  # 이름 키 -> artist_id
+        if artist_names:
+            # DB에 있는 아티스트를 대소문자 구분 없이 조회 (같은 이름이 여러 행이면 먼저 생성된 아티스트 사용)
+            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+            existing_artists = Artists.objects.annotate(
+                name_key=Lower('artist_name')
+            ).filter(
+                name_key__in=artist_names
+            ).order_by('artist_id').values_list('name_key', 'artist_id')
+            for name_key, artist_id in existing_artists:
+                artist_key_to_id.setdefault(name_key, artist_id)
             
-            for item in parsed_results:
-                item['in_db'] = item.get('itunes_id') in existing_set
-                item['has_matching_tags'] = False  # 기본값
+            # DB에 없는 아티스트를 한 번의 INSERT로 생성 (PostgreSQL은 생성된 ID를 함께 반환)
+            # TrackableMixin이 자동으로 created_at, is_deleted 설정
+            created_artists = Artists.objects.bulk_create([
+                Artists(artist_name=artist_name, artist_image='')  # 이미지는 비동기로 수집
+                for name_key, artist_name in artist_names.items()
+                if name_key not in artist_key_to_id
+            ])
+            for artist in created_artists:
+                artist_key_to_id[_name_key(artist.artist_name)] = artist.artist_id
                 
-                # 아티스트 ID 추가 (없으면 생성했으므로 항상 있음)
-                artist_name = item.get('artist_name')
-                item['artist_id'] = artist_name_to_id.get(artist_name) if artist_name else None
-                
-                # 앨범 ID 추가 (아티스트가 있어야 앨범 생성 가능)
-                album_name = item.get('album_name')
-                artist_id = item['artist_id']
-                
-                if album_name and artist_id:
-                    album_key = (album_name, artist_id)
-                    if album_key not in album_key_to_id:
-                        # 앨범 조회 또는 생성
-                        try:
-                            # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-                            artist = Artists.objects.get(artist_id=artist_id)
-                            # TrackableMixin이 자동으로 created_at, is_deleted 설정
-                            album, album_created = Albums.objects.get_or_create(
-                                album_name=album_name,
-                                artist=artist,
-                                defaults={
-                                    'album_image': '',  # 비동기로 수집
-                                }
-                            )
-                            album_key_to_id[album_key] = album.album_id
-                            
-                            # 앨범 이미지 비동기 수집 (새로 생성되었거나 이미지가 없는 경우)
-                            album_image_url = item.get('album_image', '')
-                            if album_created or not album.album_image:
-                                try:
-                                    # artist_name도 전달하여 YouTube Music 검색 정확도 향상
-                                    artist_name = item.get('artist_name', '')
-                                    fetch_album_image_task.delay(
-                                        album.album_id, 
-                                        album_name, 
-                                        album_image_url,  # iTunes fallback용
-                                        artist_name  # YouTube Music 검색용
-                                    )
-                                except Exception as e:
-                                    # 태스크 호출 실패해도 기본 저장은 완료되도록 함
-                                    import logging
-                                    logging.getLogger(__name__).warning(
-                                        f"앨범 이미지 태스크 호출 실패: {e}"
-                                    )
-                        except Artists.DoesNotExist:
-                            album_key_to_id[album_key] = None
-                    
-                    item['album_id'] = album_key_to_id[album_key]
-                else:
-                    item['album_id'] = None
+                # 새로 생성된 아티스트의 이미지 비동기 수집 (마지막에 한 번에 호출)
+                image_tasks.append(fetch_artist_image_task.si(artist.artist_id, artist.artist_name))
+        
+        for item in items:
+            itunes_id, artist_name = _itunes_link_keys(item)
+            music_id = existing_music_ids.get(itunes_id)
+            item['music_id'] = music_id
+            item['in_db'] = music_id is not None
             
-            results = parsed_results
-        
-        # 2. 태그가 있으면 필터링
-        if tags:
-            # DB에서 태그를 가진 곡의 itunes_id 찾기
+            # 아티스트 ID 추가 (없으면 생성했으므로 항상 있음)
+            item['artist_id'] = artist_key_to_id.get(_name_key(artist_name)) if artist_name else None
+        
+        # 앨범 이름과 아티스트 조합으로 DB에서 앨범 ID 조회 및 생성
+        # 앨범은 아티스트별로 구분되므로 (앨범명 키, artist_id) 조합 단위로 처리 (앨범명도 대소문자 구분 없음)
+        album_keys = {}  # (앨범명 키, artist_id) -> iTunes 표기 앨범명 (새로 생성할 때 사용)
+        for item in items:
+            if item.get('album_name') and item['artist_id']:
+                album_keys.setdefault((_name_key(item['album_name']), item['artist_id']), item['album_name'])
+        album_key_to_id = {}  # (앨범명 키, artist_id) -> album_id
+        album_key_has_image = {}  # (앨범명 키, artist_id) -> 앨범 이미지 보유 여부
+        if album_keys:
+            # DB에 있는 앨범을 한 번에 조회 (조합마다 조회하지 않음, 같은 앨범이 여러 행이면 먼저 생성된 앨범 사용)
             # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-            tag_objects = Tags.objects.filter(tag_key__in=tags)
+            existing_albums = Albums.objects.annotate(
+                name_key=Lower('album_name')
+            ).filter(
+                name_key__in={name_key for name_key, _ in album_keys},
+                artist_id__in={artist_id for _, artist_id in album_keys}
+            ).order_by('album_id').values_list('album_id', 'name_key', 'artist_id', 'album_image')
+            for album_id, name_key, artist_id, album_image in existing_albums:
+                album_key = (name_key, artist_id)
+                if album_key in album_keys and album_key not in album_key_to_id:
+                    album_key_to_id[album_key] = album_id
+                    album_key_has_image[album_key] = bool(album_image)
             
-            music_ids_with_tags = MusicTags.objects.filter(
-                tag__in=tag_objects
-            ).values_list('music__itunes_id', flat=True).distinct()
+            # DB에 없는 앨범을 한 번의 INSERT로 생성 (PostgreSQL은 생성된 ID를 함께 반환)
+            # TrackableMixin이 자동으로 created_at, is_deleted 설정
+            created_albums = Albums.objects.bulk_create([
+                Albums(album_name=album_name, artist_id=artist_id, album_image='')  # 이미지는 비동기로 수집
+                for (name_key, artist_id), album_name in album_keys.items()
+                if (name_key, artist_id) not in album_key_to_id
+            ])
+            for album in created_albums:
+                album_key = (_name_key(album.album_name), album.artist_id)
+                album_key_to_id[album_key] = album.album_id
+                album_key_has_image[album_key] = False
+        
+        image_requested_album_keys = set()
+        for item in items:
+            # 앨범 ID 추가 (아티스트가 있어야 앨범이 있음)
+            album_name = item.get('album_name')
+            artist_id = item['artist_id']
             
-            itunes_ids_with_tags = set(music_ids_with_tags)
+            if not (album_name and artist_id):
+                item['album_id'] = None
+                continue
             
-            if term:
-                # iTunes 결과 + 태그 필터링
-                for item in results:
-                    if item.get('itunes_id') in itunes_ids_with_tags:
-                        item['has_matching_tags'] = True
-                
-                # 태그 매칭된 것만 필터 (AND 로직)
-                results = [r for r in results if r['has_matching_tags']]
-            else:
-                # 태그만 검색 (#christmas)
-                # DB에서 해당 태그를 가진 음악 조회
-                # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
-                musics = Music.objects.filter(
-                    itunes_id__in=itunes_ids_with_tags
-                ).select_related('artist', 'album')
-                
-                # Music 객체를 iTunes 검색 결과 형식으로 변환
-                results = []
-                for music in musics:
-                    results.append({
-                        'itunes_id': music.itunes_id,
-                        'music_name': music.music_name,
-                        'artist_name': music.artist.artist_name if music.artist else '',
-                        'artist_id': music.artist.artist_id if music.artist else None,
-                        'album_name': music.album.album_name if music.album else '',
-                        'album_id': music.album.album_id if music.album else None,
-                        'genre': music.genre or '',
-                        'duration': music.duration,
-                        'audio_url': music.audio_url,
-                        'album_image': music.album.album_image if music.album else '',
-                        'in_db': True,
-                        'has_matching_tags': True,
-                    })
-        
-        
-        # 4. 페이지네이션
-        paginator = self.pagination_class()
-        
-        # 리스트를 페이지네이션하기 위해 임시로 변환
-        page = paginator.paginate_queryset(results, request)
-        
-        if page is not None:
-            serializer = iTunesSearchResultSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = iTunesSearchResultSerializer(results, many=True)
-        return Response({
-            'count': len(results),
-            'results': serializer.data
-        })
+            album_key = (_name_key(album_name), artist_id)
+            
+            # 앨범 이미지 비동기 수집 (새로 생성되었거나 이미지가 없는 경우, 앨범당 한 번)
+            if not album_key_has_image[album_key] and album_key not in image_requested_album_keys:
+                image_requested_album_keys.add(album_key)
+                # artist_name도 전달하여 YouTube Music 검색 정확도 향상
+                image_tasks.append(fetch_album_image_task.si(
+                    album_key_to_id[album_key],
+                    album_name,
+                    item.get('album_image', ''),  # iTunes fallback용
+                    item.get('artist_name', '')  # YouTube Music 검색용
+                ))
+            
+            item['album_id'] = album_key_to_id[album_key]
+        
+        # 아티스트/앨범 이미지 비동기 수집
+        # 브로커 호출이 트랜잭션을 붙잡지 않고, 워커가 커밋된 행을 조회하도록 커밋 후 실행
+        if image_tasks:
+            def dispatch_image_tasks():
+                try:
+                    group(image_tasks).apply_async()
+                except Exception as e:
+                    # 태스크 호출 실패해도 기본 저장은 완료되도록 함
+                    import logging
+                    logging.getLogger(__name__).warning(
+                        f"이미지 수집 태스크 호출 실패: {e}"
+                    )
+            
+            transaction.on_commit(dispatch_image_tasks)
 
 
 class AiMusicSearchView(APIView):
@@ -411,42 +591,41 @@ class AiMusicSearchView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # AI 음악만 검색 (AiInfo가 있는 음악)
+        # AI 음악만 검색 (삭제되지 않은 AiInfo가 있는 음악)
         # 노래 제목과 프롬프트를 하나의 검색어로 통합 검색
+        # 두 테이블 조건을 OR로 묶으면 인덱스를 쓰지 못하므로, 노래 제목 매칭(music)과
+        # 프롬프트 매칭(ai_info)을 각각의 trigram 인덱스로 찾은 뒤 UNION ALL로 합침
+        # IN 서브쿼리로 감싸 곡이 중복되지 않음 (DISTINCT 불필요, select_related/페이지네이션 그대로 사용)
+        title_matches = Music.objects.filter(
+            Exists(AiInfo.objects.filter(music=OuterRef('pk'), is_deleted=False)),
+            music_name__icontains=query
+        ).values('pk')
+        prompt_matches = AiInfo.objects.filter(
+            input_prompt__icontains=query,
+            is_deleted=False
+        ).values('music_id')
         music_queryset = Music.objects.filter(
-            # AiInfo 레코드가 있는 음악만 (AI 생성 음악)
-            aiinfo__isnull=False
-        ).filter(
-            # 삭제되지 않은 AiInfo만
-            aiinfo__is_deleted__in=[False, None]
-        ).filter(
-            # 노래 제목 또는 AI 프롬프트에서 검색 (통합 검색)
-            Q(music_name__icontains=query) |
-            Q(aiinfo__input_prompt__icontains=query)
+            pk__in=title_matches.union(prompt_matches, all=True)
         ).select_related(
             'artist',  # 아티스트 정보
             'album',   # 앨범 정보
+        ).only(
+            # 응답에 쓰는 컬럼만 조회 (가사 등 큰 컬럼 제외)
+            *AI_MUSIC_SEARCH_FIELDS
         ).prefetch_related(
             Prefetch(
                 'aiinfo_set',
-                queryset=AiInfo.objects.filter(is_deleted__in=[False, None]),
+                # 시리얼라이저의 ai_info(첫 번째 AiInfo)와 같은 순서로 정렬
+                queryset=AiInfo.objects.filter(is_deleted=False).order_by('aiinfo_id'),
                 to_attr='ai_info_list'
             )
-        ).distinct().order_by('-created_at')  # 최신순 정렬
+        ).order_by('-created_at')  # 최신순 정렬
         
-        # 페이지네이션
+        # 페이지네이션 (MusicPagination은 기본 page_size가 있어 항상 한 페이지만 조회/직렬화)
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(music_queryset, request)
-        
-        if page is not None:
-            serializer = AiMusicSearchResultSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = AiMusicSearchResultSerializer(music_queryset, many=True)
-        return Response({
-            'count': music_queryset.count(),
-            'results': serializer.data
-        })
+        serializer = AiMusicSearchResultSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class TagMusicSearchView(APIView):
@@ -460,7 +639,7 @@ class TagMusicSearchView(APIView):
     GET /api/v1/search/tags?tag={tag_key}&tag={tag_key2}&tag={tag_key3}&page={num}&page_size={num}
     """
     permission_classes = [AllowAny]
-    pagination_class = MusicPagination
+    pagination_class = TagSearchPagination
     
     @extend_schema(
         summary="태그로 음악 검색",
@@ -564,107 +743,46 @@ class TagMusicSearchView(APIView):
             )
         
         # 2. 각 태그에 대해 음악 조회 (OR 조건)
-        # MusicTags를 통해 Music을 직접 조회 (album, artist 포함)
-        music_tags = MusicTags.objects.filter(
+        # 중복 제거(music_id 기준)와 최고 score 선택을 DB에서 GROUP BY로 처리 (곡당 한 행만 전송)
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        music_scores = dict(MusicTags.objects.filter(
             tag__in=tags,
-            is_deleted=False
-        ).select_related(
-            'music',      # 음악 정보
-            'music__album',  # 앨범 정보
-            'music__artist'  # 아티스트 정보
-        )
-        
-        # 3. 삭제되지 않은 음악만 필터링하고 중복 제거 (music_id 기준)
-        # 중복 시 가장 높은 score를 가진 것을 유지
-        music_dict = {}  # music_id를 키로 사용하여 중복 제거
-        for mt in music_tags:
-            if mt.music and not mt.music.is_deleted:
-                music_id = mt.music.music_id
-                # 중복된 경우 더 높은 score를 가진 것을 유지
-                if music_id not in music_dict:
-                    music_dict[music_id] = {
-                        'music': mt.music,
-                        'score': mt.score if mt.score is not None else 0.0
-                    }
-                else:
-                    # 기존 score보다 높으면 업데이트
-                    if mt.score is not None and mt.score > music_dict[music_id]['score']:
-                        music_dict[music_id]['score'] = mt.score
-        
-        # 리스트로 변환
-        music_list = list(music_dict.values())
-        
-        # 랜덤으로 섞기 (중복 없음 보장)
-        random.shuffle(music_list)
+            music__is_deleted=False
+        ).values('music_id').annotate(
+            max_score=Max('score')
+        ).values_list('music_id', 'max_score'))
         
-        # 최대 150개로 제한
-        music_list = music_list[:150]
+        # 3. 최대 150개를 랜덤 순서로 추출 (전체를 섞지 않고 필요한 개수만 샘플링, 중복 없음 보장)
+        music_ids = random.sample(list(music_scores), min(TAG_SEARCH_MAX_RESULTS, len(music_scores)))
         
-        # queryset처럼 사용하기 위해 리스트를 사용
-        # 페이지네이션을 위해 리스트를 사용
-        
-        # 4. 결과 데이터 생성
-        results = []
-        for item in music_list:
-            music = item['music']
-            score = item['score']
-            album = music.album
-            artist = music.artist
-            
-            results.append({
-                'music_id': music.music_id,
-                'music_name': music.music_name,
-                'album_name': album.album_name if album else None,
-                'artist_name': artist.artist_name if artist else None,
-                'image_large_square': album.image_large_square if album else None,
-                'image_square': album.image_square if album else None,
-                'album_image': album.album_image if album else None,
-                'score': score,
-            })
-        
-        # 5. 페이지네이션
+        # 4. 페이지네이션 (샘플링된 ID 목록을 먼저 자르고 현재 페이지의 곡만 조회)
         paginator = self.pagination_class()
-        # 리스트를 페이지네이션하기 위해 임시로 queryset처럼 사용
-        # 페이지네이션은 리스트를 직접 처리할 수 없으므로 수동으로 처리
-        page = request.query_params.get('page', 1)
-        page_size = request.query_params.get('page_size', 20)
-        
-        try:
-            page = int(page)
-            page_size = int(page_size)
-            page_size = min(page_size, 150)  # 최대 150개
-        except (ValueError, TypeError):
-            page = 1
-            page_size = 20
-        
-        # 페이지네이션 계산
-        total_count = len(results)
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_results = results[start:end]
-        
-        # Serializer로 변환
-        serializer = TagMusicSearchSerializer(paginated_results, many=True)
-        
-        # 페이지네이션 메타데이터 생성
-        next_page = None
-        previous_page = None
-        
-        if end < total_count:
-            next_page = page + 1
-        if start > 0:
-            previous_page = page - 1
-        
-        # URL 파라미터 재구성 (여러 태그 포함, 쉼표로 구분)
-        base_url = request.build_absolute_uri().split('?')[0]
-        tag_params = f"tag={','.join(tag_keys)}"
-        
-        # 응답 데이터 구성
-        response_data = {
-            'count': total_count,
-            'next': f"{base_url}?{tag_params}&page={next_page}&page_size={page_size}" if next_page else None,
-            'previous': f"{base_url}?{tag_params}&page={previous_page}&page_size={page_size}" if previous_page else None,
-            'results': serializer.data
+        page_music_ids = paginator.paginate_queryset(music_ids, request)
+        
+        # 현재 페이지의 곡만 응답 필드 이름의 dict로 바로 조회 (모델 인스턴스 생성 없이 앨범/아티스트 JOIN)
+        # SoftDeleteManager가 자동으로 is_deleted=False인 레코드만 조회
+        rows_by_id = {
+            row['music_id']: row
+            for row in Music.objects.filter(music_id__in=page_music_ids).values(
+                'music_id',
+                'music_name',
+                album_name=F('album__album_name'),
+                artist_name=F('artist__artist_name'),
+                image_large_square=F('album__image_large_square'),
+                image_square=F('album__image_square'),
+                album_image=F('album__album_image'),
+            )
         }
         
-        return Response(response_data)
+        # 5. 결과 데이터 생성 (샘플링된 순서 유지, 점수는 집계 결과에서)
+        results = []
+        for music_id in page_music_ids:
+            row = rows_by_id.get(music_id)
+            if row is None:
+                continue
+            score = music_scores[music_id]
+            row['score'] = score if score is not None else 0.0
+            results.append(row)
+        
+        serializer = TagMusicSearchSerializer(results, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -2,12 +2,17 @@
 사용자 통계 API View
 """
 import logging
+from functools import wraps
+from django.utils.cache import get_conditional_response, patch_cache_control, set_response_etag
 from rest_framework import status
+from rest_framework.exceptions import APIException
 from rest_framework.views import APIView
+from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 
+from music.renderers import ORJSONRenderer
 from music.services.internal.user_statistics import UserStatisticsService
 from music.serializers.statistics import (
     UserStatisticsSerializer,
@@ -18,12 +23,119 @@ from music.serializers.statistics import (
     TrackStatSerializer,
     AIGenerationStatSerializer
 )
+from music.utils.statistics_cache import UncachedResult, get_or_compute_statistics, get_statistics_cache_key
 
 logger = logging.getLogger(__name__)
 
+# 조회 기간 (이번 달, 전체)
+STATISTICS_PERIODS = ('month', 'all')
+
+# 브라우저가 통계 응답을 재사용하는 시간 (초), 이후에는 ETag로 변경 여부만 확인
+STATISTICS_BROWSER_CACHE_MAX_AGE = 60
+
+# Top N 통계에서 허용하는 최대 limit (과도한 집계/직렬화 방지)
+STATISTICS_MAX_LIMIT = 50
+
+# 모든 통계 API가 공유하는 period 쿼리 파라미터 (API 문서용)
+PERIOD_PARAMETER = OpenApiParameter(
+    name='period',
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
+    required=False,
+    default='month',
+    examples=[
+        OpenApiExample(name='이번 달', value='month'),
+        OpenApiExample(name='전체 기간', value='all'),
+    ]
+)
+
+
+def _limit_parameter(target: str, default: int) -> OpenApiParameter:
+    """Top N 통계 API의 limit 쿼리 파라미터 (API 문서용)"""
+    return OpenApiParameter(
+        name='limit',
+        type=OpenApiTypes.INT,
+        location=OpenApiParameter.QUERY,
+        description=f'반환할 Top {target} 수 (기본값: {default}, 최대 {STATISTICS_MAX_LIMIT})',
+        required=False,
+        default=default
+    )
+
+
+def _parse_limit(request, default: int, maximum: int = STATISTICS_MAX_LIMIT) -> int:
+    """limit 쿼리 파라미터 파싱 (숫자가 아니면 기본값 사용, 1 ~ maximum 범위로 제한)"""
+    try:
+        limit = int(request.query_params.get('limit', default))
+    except ValueError:
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+def _require_period(get):
+    """
+    period 쿼리 파라미터 검증 데코레이터
+
+    잘못된 값이면 집계 전에 400을 반환하고, 검증된 값을 period 인자로 전달합니다.
+    """
+    @wraps(get)
+    def wrapper(self, request, *args, **kwargs):
+        period = request.query_params.get('period', 'month')
+        if period not in STATISTICS_PERIODS:
+            return Response(
+                {'error': 'Invalid period. Use "month" or "all".'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return get(self, request, *args, period=period, **kwargs)
+    return wrapper
+
+
+class _StatisticsView(APIView):
+    """
+    사용자 통계 API 공통 View
+
+    - 통계는 URL의 user_id로 조회하는 공개 API이므로 JWT 검증/사용자 조회를 생략
+    - 예상하지 못한 오류는 View마다 try/except를 두지 않고 여기서 로깅 후 500(error_message)으로 응답
+    - 성공 응답에 Cache-Control/ETag를 붙여, 내용이 바뀌지 않았으면 304로 본문 전송을 생략
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    renderer_classes = [ORJSONRenderer]  # 통계 응답(Top N 목록 포함)을 orjson으로 직렬화
+    error_message = '통계를 조회하는 중 오류가 발생했습니다.'
+    
+    def handle_exception(self, exc):
+        # 400/404 등 DRF 예외는 기본 처리 그대로 사용
+        if isinstance(exc, APIException):
+            return super().handle_exception(exc)
+        
+        user_id = self.kwargs.get('user_id')
+        logger.error(f"[{type(self).__name__}] 조회 실패: user_id={user_id}, error={exc}", exc_info=True)
+        return Response(
+            {'error': self.error_message},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method != 'GET' or response.status_code != status.HTTP_200_OK:
+            return response
+        
+        # 사용자별 데이터이므로 공유 캐시(CDN/프록시)에는 저장하지 않고 브라우저에서만 재사용
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=STATISTICS_BROWSER_CACHE_MAX_AGE,
+            stale_while_revalidate=STATISTICS_BROWSER_CACHE_MAX_AGE * 5
+        )
+        
+        # 렌더링된 본문으로 ETag를 만들어 If-None-Match가 같으면 304 반환
+        response.render()
+        set_response_etag(response)
+        return get_conditional_response(request, etag=response.get('ETag'), response=response)
+
 
 @extend_schema(tags=['사용자 통계'])
-class UserStatisticsView(APIView):
+class UserStatisticsView(_StatisticsView):
     """
     사용자 개인 음악 분석 데이터 API
     
@@ -35,23 +147,14 @@ class UserStatisticsView(APIView):
     @extend_schema(
         summary="사용자 전체 음악 통계 조회",
         description="사용자의 청취 시간, Top 장르, Top 아티스트, Top 태그, AI 생성 활동 등 전체 통계를 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            )
-        ],
-        responses={200: UserStatisticsSerializer}
+        parameters=[PERIOD_PARAMETER],
+        responses={
+            200: UserStatisticsSerializer,
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
+    @_require_period
+    def get(self, request, user_id: int, period: str):
         """
         사용자의 전체 음악 통계를 반환합니다.
         
@@ -86,309 +189,203 @@ class UserStatisticsView(APIView):
                 }
             }
         """
-        period = request.query_params.get('period', 'month')
-        
-        if period not in ['month', 'all']:
-            return Response(
-                {'error': 'Invalid period. Use "month" or "all".'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            statistics = UserStatisticsService.get_full_statistics(user_id, period)
-            serializer = UserStatisticsSerializer(statistics)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserStatistics] 통계 조회 실패: user_id={user_id}, error={e}", exc_info=True)
-            return Response(
-                {'error': '통계를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        # 일부 통계가 기본값으로 대체된 경우 일시적인 오류가 TTL 동안 유지되지 않도록 캐싱하지 않음
+        def compute():
+            statistics, failed_keys = UserStatisticsService.get_full_statistics_with_failures(user_id, period)
+            data = UserStatisticsSerializer(statistics).data
+            return UncachedResult(data) if failed_keys else data
+
+        data = get_or_compute_statistics(get_statistics_cache_key(user_id, 'full', period), compute)
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserListeningTimeView(APIView):
+class UserListeningTimeView(_StatisticsView):
     """
     사용자 청취 시간 통계 API
     
     GET /api/users/{user_id}/statistics/listening-time/
     """
+    error_message = '청취 시간을 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 청취 시간 통계 조회",
         description="사용자의 총 청취 시간, 재생 횟수, 전월 대비 변화율을 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            )
-        ],
-        responses={200: ListeningTimeSerializer}
+        parameters=[PERIOD_PARAMETER],
+        responses={
+            200: ListeningTimeSerializer,
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        
-        try:
-            data = UserStatisticsService.get_listening_time(user_id, period)
-            serializer = ListeningTimeSerializer(data)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserListeningTime] 조회 실패: user_id={user_id}, error={e}")
-            return Response(
-                {'error': '청취 시간을 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'listening_time', period),
+            lambda: ListeningTimeSerializer(UserStatisticsService.get_listening_time(user_id, period)).data
+        )
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserTopGenresView(APIView):
+class UserTopGenresView(_StatisticsView):
     """
     사용자 Top 장르 통계 API
     
     GET /api/users/{user_id}/statistics/genres/
     """
+    error_message = '장르 통계를 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 Top 장르 통계 조회",
         description="사용자가 가장 많이 들은 장르 목록을 재생 횟수 순으로 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            ),
-            OpenApiParameter(
-                name='limit',
-                type=OpenApiTypes.INT,
-                location=OpenApiParameter.QUERY,
-                description='반환할 Top 장르 수 (기본값: 3)',
-                required=False,
-                default=3
-            )
-        ],
-        responses={200: GenreStatSerializer(many=True)}
+        parameters=[PERIOD_PARAMETER, _limit_parameter('장르', 3)],
+        responses={
+            200: GenreStatSerializer(many=True),
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        limit = int(request.query_params.get('limit', 3))
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        limit = _parse_limit(request, 3)
         
-        try:
-            data = UserStatisticsService.get_top_genres(user_id, period, limit)
-            serializer = GenreStatSerializer(data, many=True)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserTopGenres] 조회 실패: user_id={user_id}, error={e}")
-            return Response(
-                {'error': '장르 통계를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        # 서비스가 응답 형식 그대로의 dict 목록을 반환하므로 Serializer를 거치지 않음
+        # (GenreStatSerializer는 API 문서용)
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'genres', period, limit),
+            lambda: UserStatisticsService.get_top_genres(user_id, period, limit)
+        )
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserTopArtistsView(APIView):
+class UserTopArtistsView(_StatisticsView):
     """
     사용자 Top 아티스트 통계 API
     
     GET /api/users/{user_id}/statistics/artists/
     """
+    error_message = '아티스트 통계를 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 Top 아티스트 통계 조회",
         description="사용자가 가장 많이 들은 아티스트 목록을 재생 횟수 순으로 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            ),
-            OpenApiParameter(
-                name='limit',
-                type=OpenApiTypes.INT,
-                location=OpenApiParameter.QUERY,
-                description='반환할 Top 아티스트 수 (기본값: 3)',
-                required=False,
-                default=3
-            )
-        ],
-        responses={200: ArtistStatSerializer(many=True)}
+        parameters=[PERIOD_PARAMETER, _limit_parameter('아티스트', 3)],
+        responses={
+            200: ArtistStatSerializer(many=True),
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        limit = int(request.query_params.get('limit', 3))
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        limit = _parse_limit(request, 3)
         
-        try:
-            data = UserStatisticsService.get_top_artists(user_id, period, limit)
-            serializer = ArtistStatSerializer(data, many=True)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserTopArtists] 조회 실패: user_id={user_id}, error={e}")
-            return Response(
-                {'error': '아티스트 통계를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        # 서비스가 응답 형식 그대로의 dict 목록을 반환하므로 Serializer를 거치지 않음
+        # (ArtistStatSerializer는 API 문서용)
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'artists', period, limit),
+            lambda: UserStatisticsService.get_top_artists(user_id, period, limit)
+        )
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserTopTagsView(APIView):
+class UserTopTagsView(_StatisticsView):
     """
     사용자 Top 태그(분위기/키워드) 통계 API
     
     GET /api/users/{user_id}/statistics/tags/
     """
+    error_message = '태그 통계를 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 Top 태그/키워드 통계 조회",
         description="사용자가 가장 많이 들은 태그(분위기/키워드) 목록을 재생 횟수 순으로 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            ),
-            OpenApiParameter(
-                name='limit',
-                type=OpenApiTypes.INT,
-                location=OpenApiParameter.QUERY,
-                description='반환할 Top 태그 수 (기본값: 6)',
-                required=False,
-                default=6
-            )
-        ],
-        responses={200: TagStatSerializer(many=True)}
+        parameters=[PERIOD_PARAMETER, _limit_parameter('태그', 6)],
+        responses={
+            200: TagStatSerializer(many=True),
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        limit = int(request.query_params.get('limit', 6))
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        limit = _parse_limit(request, 6)
         
-        try:
-            data = UserStatisticsService.get_top_tags(user_id, period, limit)
-            serializer = TagStatSerializer(data, many=True)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserTopTags] 조회 실패: user_id={user_id}, error={e}")
-            return Response(
-                {'error': '태그 통계를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        # 서비스가 응답 형식 그대로의 dict 목록을 반환하므로 Serializer를 거치지 않음
+        # (TagStatSerializer는 API 문서용)
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'tags', period, limit),
+            lambda: UserStatisticsService.get_top_tags(user_id, period, limit)
+        )
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserTopTracksView(APIView):
+class UserTopTracksView(_StatisticsView):
     """
     사용자 Top 음악 차트 API
     
     GET /api/users/{user_id}/statistics/tracks/
     """
+    error_message = '음악 차트를 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 Top 음악 차트 조회",
         description="사용자가 가장 많이 들은 음악 목록을 재생 횟수 순으로 반환합니다. (기본 Top 15)",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            ),
-            OpenApiParameter(
-                name='limit',
-                type=OpenApiTypes.INT,
-                location=OpenApiParameter.QUERY,
-                description='반환할 Top 음악 수 (기본값: 15)',
-                required=False,
-                default=15
-            )
-        ],
-        responses={200: TrackStatSerializer(many=True)}
+        parameters=[PERIOD_PARAMETER, _limit_parameter('음악', 15)],
+        responses={
+            200: TrackStatSerializer(many=True),
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        limit = int(request.query_params.get('limit', 15))
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        limit = _parse_limit(request, 15)
         
-        try:
-            data = UserStatisticsService.get_top_tracks(user_id, period, limit)
-            serializer = TrackStatSerializer(data, many=True)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserTopTracks] 조회 실패: user_id={user_id}, error={e}")
-            return Response(
-                {'error': '음악 차트를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        # 서비스가 응답 형식 그대로의 dict 목록을 반환하므로 Serializer를 거치지 않음
+        # (TrackStatSerializer는 API 문서용)
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'tracks', period, limit),
+            lambda: UserStatisticsService.get_top_tracks(user_id, period, limit)
+        )
+        return Response(data)
 
 
 @extend_schema(tags=['사용자 통계'])
-class UserAIGenerationView(APIView):
+class UserAIGenerationView(_StatisticsView):
     """
     사용자 AI 생성 활동 통계 API
     
     GET /api/users/{user_id}/statistics/ai-generation/
     """
+    error_message = 'AI 생성 통계를 조회하는 중 오류가 발생했습니다.'
     
     @extend_schema(
         summary="사용자 AI 음악 생성 활동 통계 조회",
         description="사용자가 AI로 생성한 음악의 총 개수와 마지막 생성 시점을 반환합니다.",
-        parameters=[
-            OpenApiParameter(
-                name='period',
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description='조회 기간: "month" (이번 달, 기본값) 또는 "all" (전체)',
-                required=False,
-                default='month',
-                examples=[
-                    OpenApiExample(name='이번 달', value='month'),
-                    OpenApiExample(name='전체 기간', value='all'),
-                ]
-            )
-        ],
-        responses={200: AIGenerationStatSerializer}
+        parameters=[PERIOD_PARAMETER],
+        responses={
+            200: AIGenerationStatSerializer,
+            400: {'description': 'Bad Request - 잘못된 period 값'},
+        }
     )
-    def get(self, request, user_id: int):
-        period = request.query_params.get('period', 'month')
-        
-        try:
-            data = UserStatisticsService.get_ai_generation_stats(user_id, period)
-            serializer = AIGenerationStatSerializer(data)
-            return Response(serializer.data)
-        except Exception as e:
-            logger.error(f"[UserAIGeneration] 조회 실패: user_id={user_id}, error={e}", exc_info=True)
-            return Response(
-                {'error': 'AI 생성 통계를 조회하는 중 오류가 발생했습니다.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+    @_require_period
+    def get(self, request, user_id: int, period: str):
+        # 캐시된 통계가 있으면 집계 쿼리와 직렬화 없이 반환 (재생 기록 저장 시 무효화)
+        # 캐시가 비어 있으면 같은 통계의 동시 요청 중 한 요청만 집계
+        data = get_or_compute_statistics(
+            get_statistics_cache_key(user_id, 'ai_generation', period),
+            lambda: AIGenerationStatSerializer(UserStatisticsService.get_ai_generation_stats(user_id, period)).data
+        )
+        return Response(data)
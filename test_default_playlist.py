@@ -18,6 +18,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.utils import timezone
 from music.models import Users, Playlists
 
@@ -31,33 +32,35 @@ def test_default_playlist_creation():
     # 테스트용 이메일
     test_email = "test_signal_user@example.com"
     
-    # 1. 기존 테스트 사용자 삭제
-    print("1. 기존 테스트 사용자 확인 및 삭제...")
-    existing_users = Users.objects.filter(email=test_email)
-    if existing_users.exists():
-        print(f"   기존 사용자 발견: {existing_users.count()}명")
-        existing_users.update(is_deleted=True, updated_at=timezone.now())
-        print("   기존 사용자 소프트 삭제 완료")
-    else:
-        print("   기존 사용자 없음")
+    # 1~2단계를 하나의 트랜잭션으로 처리
+    # 커밋 시점에 시그널의 on_commit 콜백(기본 플레이리스트 생성)이 이 스레드에서 바로 실행되므로
+    # 블록이 끝나면 플레이리스트가 이미 생성되어 있음 (별도 대기 불필요)
+    with transaction.atomic():
+        # 1. 기존 테스트 사용자 삭제
+        print("1. 기존 테스트 사용자 확인 및 삭제...")
+        existing_users = Users.objects.filter(email=test_email)
+        if existing_users.exists():
+            print(f"   기존 사용자 발견: {existing_users.count()}명")
+            existing_users.update(is_deleted=True, updated_at=timezone.now())
+            print("   기존 사용자 소프트 삭제 완료")
+        else:
+            print("   기존 사용자 없음")
     
-    # 2. 새 사용자 생성
-    print("\n2. 새 사용자 생성 중...")
-    now = timezone.now()
-    user = Users.objects.create(
-        email=test_email,
-        password=make_password("TestPassword123!"),
-        nickname="테스트시그널유저",
-        created_at=now,
-        updated_at=now,
-        is_deleted=False
-    )
-    print(f"   [OK] 사용자 생성 완료: user_id={user.user_id}, email={user.email}")
+        # 2. 새 사용자 생성
+        print("\n2. 새 사용자 생성 중...")
+        now = timezone.now()
+        user = Users.objects.create(
+            email=test_email,
+            password=make_password("TestPassword123!"),
+            nickname="테스트시그널유저",
+            created_at=now,
+            updated_at=now,
+            is_deleted=False
+        )
+        print(f"   [OK] 사용자 생성 완료: user_id={user.user_id}, email={user.email}")
     
     # 3. 플레이리스트 확인
     print("\n3. 자동 생성된 플레이리스트 확인 중...")
-    import time
-    time.sleep(1)  # signal 처리 대기
     
     playlists = Playlists.objects.filter(user=user, is_deleted=False)
     print(f"   플레이리스트 개수: {playlists.count()}")